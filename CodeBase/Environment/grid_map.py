@@ -14,38 +14,98 @@ class GridMap:
     Represents the environment as a 2D grid map.
     
     The grid stores free cells (0) and obstacles (1) in grid coordinates.
-    Note that grid indexing uses [row][column] which corresponds to [gy][gx],
+    Note that grid indexing uses [row, column] which corresponds to [gy, gx],
     where y is the row and x is the column.
     
     The grid also supports obstacle inflation, where cells within the robot's
     radius of an obstacle are marked as blocked to ensure the robot can fit
     through passages.
+    
+    For fast lookups both layers are also packed into a single uint8
+    occupancy array (occ), where bit 0 marks obstacles and bit 1 marks
+    inflated cells, so a cell is traversable exactly when occ[gy, gx] == 0.
+    
+    The single-cell queries read cells with ndarray.item(), which returns
+    a plain Python int/bool and avoids creating a numpy scalar per call.
     """
 
+    # Bit flags used in the packed occupancy array
+    OBSTACLE = 1
+    INFLATED = 2
+
     def __init__(self, grid_array, resolution):
         """
         Initialize the grid map with a numpy array.
         
         Args:
-            grid_array: 2D numpy array where 0 = free, 1 = obstacle
+            grid_array: 2D numpy array where 0 = free, 1 = obstacle. Stored
+                as a C-contiguous uint8 array; arrays of another dtype or
+                with other strides (e.g. a flipped view) are copied once
             resolution: Size of each grid cell in world units (e.g., meters)
         """
         self.height, self.width = grid_array.shape
         self.resolution = resolution
-        self.grid = grid_array
+        self.grid = np.ascontiguousarray(grid_array, dtype=np.uint8)
+
+        # Inflation mask: one byte per cell, all False until inflation runs
+        self.inflated_grid = np.zeros((self.height, self.width), dtype=np.bool_)
 
-        # Inflated grid is created lazily when obstacle inflation is needed
-        # This saves memory if inflation is never used
-        self.inflated_grid = None
+        # Packed occupancy: obstacle and inflation flags in one byte per cell
+        self.occ = np.zeros((self.height, self.width), dtype=np.uint8)
+
+        # Tables derived from occ by the planners (see free_move_table),
+        # keyed by move count; emptied whenever the occupancy changes
+        self.free_moves_cache = {}
+        self.update_occupancy()
 
     def init_inflation(self):
         """
-        Initialize the inflated grid for obstacle inflation.
+        Reset the inflated grid before obstacle inflation.
         
-        Creates a boolean array to track which cells are blocked due to
+        Clears the boolean array that tracks which cells are blocked due to
         obstacle inflation (cells too close to obstacles for the robot to fit).
+        The array is zeroed in place rather than reallocated.
+        """
+        self.inflated_grid.fill(False)
+        self.occ &= ~np.uint8(self.INFLATED)
+        self.free_moves_cache.clear()
+
+    def update_occupancy(self):
+        """
+        Rebuild the packed occupancy array from grid and inflated_grid.
+        
+        Must be called after either array is modified directly; set_cell,
+        mark_inflated and mark_inflated_bulk keep occ in sync already.
+        """
+        np.equal(self.grid, 1, out=self.occ, casting="unsafe")
+        self.occ |= self.inflated_grid.view(np.uint8) << 1
+        self.free_moves_cache.clear()
+
+    def __getstate__(self):
+        """
+        Pickle the map without its derived tables.
+        
+        The free-neighbor tables are nested lists, far larger pickled than
+        the arrays they come from; a worker process rebuilds them on use.
+        """
+        state = self.__dict__.copy()
+        state["free_moves_cache"] = {}
+        return state
+
+    def clone(self):
         """
-        self.inflated_grid = np.zeros((self.height, self.width), dtype=bool)
+        Create an independent copy of this grid map.
+
+        Copies the grid and inflation arrays directly with ndarray.copy(),
+        which is much cheaper than copy.deepcopy() on the whole object.
+
+        Returns:
+            New GridMap with its own copies of grid and inflated_grid
+        """
+        other = GridMap(self.grid.copy(), self.resolution)
+        other.inflated_grid[...] = self.inflated_grid
+        other.occ[...] = self.occ
+        return other
 
     def set_cell(self, gx, gy, value):
         """
@@ -56,7 +116,12 @@ class GridMap:
             gy: Grid y coordinate (row)
             value: 0 for free, 1 for obstacle
         """
-        self.grid[gy][gx] = value
+        self.grid[gy, gx] = value
+        if value == 1:
+            self.occ[gy, gx] |= self.OBSTACLE
+        else:
+            self.occ[gy, gx] &= ~np.uint8(self.OBSTACLE)
+        self.free_moves_cache.clear()
 
     def mark_inflated(self, gx, gy):
         """
@@ -66,7 +131,37 @@ class GridMap:
             gx: Grid x coordinate
             gy: Grid y coordinate
         """
-        self.inflated_grid[gy][gx] = True
+        self.inflated_grid[gy, gx] = True
+        self.occ[gy, gx] |= self.INFLATED
+        self.free_moves_cache.clear()
+
+    def mark_inflated_bulk(self, mask):
+        """
+        Mark every cell set in a boolean mask as blocked by inflation.
+        
+        The mask is OR-ed into inflated_grid and occ with whole-array
+        operations, so this is the way to apply a computed inflation
+        instead of calling mark_inflated per cell.
+        
+        Args:
+            mask: 2D boolean array with the same shape as the grid
+        """
+        self.mark_inflated_region(0, self.height, 0, self.width, mask)
+
+    def mark_inflated_region(self, y0, y1, x0, x1, sub_mask):
+        """
+        Mark cells of a rectangular region as blocked by inflation.
+        
+        Args:
+            y0, y1: Row range [y0, y1) of the region
+            x0, x1: Column range [x0, x1) of the region
+            sub_mask: Boolean array of shape (y1 - y0, x1 - x0); True cells
+                are marked
+        """
+        sub_mask = np.asarray(sub_mask, dtype=np.bool_)
+        self.inflated_grid[y0:y1, x0:x1] |= sub_mask
+        self.occ[y0:y1, x0:x1] |= sub_mask.view(np.uint8) << 1
+        self.free_moves_cache.clear()
 
     def get_cell(self, gx, gy):
         """
@@ -79,7 +174,7 @@ class GridMap:
         Returns:
             0 for free, 1 for obstacle
         """
-        return self.grid[gy][gx]
+        return self.grid.item(gy, gx)
 
     def is_inside(self, gx, gy):
         """
@@ -105,7 +200,7 @@ class GridMap:
         Returns:
             True if cell is free, False if it's an obstacle
         """
-        return True if self.grid[gy][gx] == 0 else False
+        return self.grid.item(gy, gx) == 0
 
     def is_obstacle(self, gx, gy):
         """
@@ -118,7 +213,7 @@ class GridMap:
         Returns:
             True if cell is an obstacle, False otherwise
         """
-        return True if self.grid[gy][gx] == 1 else False
+        return self.grid.item(gy, gx) == 1
     
     def is_inflated(self, gx, gy):
         """
@@ -134,9 +229,4 @@ class GridMap:
         Returns:
             True if cell is blocked by inflation, False otherwise
         """
-        if self.inflated_grid is None:
-            return False
-        return self.inflated_grid[gy][gx]
-    
-    
-    
\ No newline at end of file
+        return self.inflated_grid.item(gy, gx)
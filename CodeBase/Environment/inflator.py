@@ -8,8 +8,130 @@ as blocked to ensure the robot can actually fit through passages. This process
 """
 
 import math
+from functools import lru_cache
+
+import numpy as np
 from .obstacle import Obstacle
 
+# Below this fraction of obstacle cells, stamping the footprint around each
+# obstacle touches less memory than dilating the whole grid
+SPARSE_OBSTACLE_DENSITY = 0.01
+
+
+@lru_cache(maxsize=None)
+def footprint(reach, res):
+    """
+    Build the inflation footprint for a given reach and grid resolution.
+    
+    The footprint only depends on these two numbers, so it is computed once
+    and reused for every map inflated with the same robot and resolution.
+    The returned arrays are read-only because they are shared.
+    
+    Args:
+        reach: Inflation distance in world units (robot + obstacle radius)
+        res: Grid resolution in world units
+        
+    Returns:
+        Tuple (disk, dxs, dys): the (2r+1, 2r+1) boolean stamp centered on
+        the obstacle cell, and the x/y offsets of its True cells
+    """
+    r = int(math.ceil(reach / res))
+    offsets = np.arange(-r, r + 1)
+    dys, dxs = np.meshgrid(offsets, offsets, indexing="ij")
+    # Compare squared distances so no square root is needed
+    wx = dxs * res
+    wy = dys * res
+    disk = wx * wx + wy * wy < reach * reach
+
+    dxs, dys = dxs[disk], dys[disk]
+    for a in (disk, dxs, dys):
+        a.flags.writeable = False
+    return disk, dxs, dys
+
+
+def dilate(mask, dxs, dys):
+    """
+    Binary dilation of a boolean mask with an arbitrary footprint.
+    
+    For every footprint offset the whole mask is shifted by (dx, dy) and
+    OR-ed into the result, so each offset costs one vectorized pass over
+    the grid regardless of how many cells are set.
+    
+    Args:
+        mask: 2D boolean array (height, width)
+        dxs, dys: Integer arrays with the footprint cell offsets
+        
+    Returns:
+        New 2D boolean array with every cell within the footprint of a
+        set cell of mask marked True
+    """
+    h, w = mask.shape
+    out = np.zeros_like(mask)
+    for dx, dy in zip(dxs.tolist(), dys.tolist()):
+        if abs(dx) >= w or abs(dy) >= h:
+            continue
+        # out[y + dy, x + dx] |= mask[y, x], clipped to the grid
+        out[max(dy, 0):h + min(dy, 0), max(dx, 0):w + min(dx, 0)] |= \
+            mask[max(-dy, 0):h + min(-dy, 0), max(-dx, 0):w + min(-dx, 0)]
+    return out
+
+
+def stamp(inflated, xs, ys, dxs, dys):
+    """
+    Mark every cell at the given offsets around each obstacle as inflated.
+    
+    Work is proportional to the number of obstacles times the footprint
+    size, which beats a whole-grid dilation when obstacles are sparse.
+    Cells are addressed by flat index, so with obstacles in row-major order
+    (as the grid factory produces them) each offset writes through the
+    grid front to back.
+    
+    Args:
+        inflated: C-contiguous 2D boolean array (height, width) to mark,
+            modified in place
+        xs, ys: Integer arrays with the obstacle grid coordinates
+        dxs, dys: Integer arrays with the footprint cell offsets
+    """
+    h, w = inflated.shape
+    flat = inflated.reshape(-1)
+    base = ys.astype(np.intp) * w + xs
+    for dx, dy in zip(dxs.tolist(), dys.tolist()):
+        inside = (xs >= -dx) & (xs < w - dx) & (ys >= -dy) & (ys < h - dy)
+        flat[base[inside] + (dy * w + dx)] = True
+
+
+def stamp_windows(inflated, xs, ys, disk):
+    """
+    OR a footprint mask into the window around each obstacle.
+    
+    Each obstacle only touches its (2r+1) x (2r+1) bounding box, clipped
+    to the grid, so the cost per obstacle is one small slice operation.
+    This is the cheapest option when there are few obstacles compared to
+    the number of footprint cells (large robot, sparse map). The window
+    bounds of all obstacles are computed up front in a few array passes.
+    
+    Args:
+        inflated: 2D boolean array (height, width) to mark, modified in place
+        xs, ys: Integer arrays with the obstacle grid coordinates
+        disk: (2r+1, 2r+1) boolean footprint mask centered on the obstacle
+    """
+    h, w = inflated.shape
+    r = disk.shape[0] // 2
+    # Grid window and matching disk window of every obstacle
+    x0 = np.maximum(xs - r, 0)
+    x1 = np.minimum(xs + r + 1, w)
+    y0 = np.maximum(ys - r, 0)
+    y1 = np.minimum(ys + r + 1, h)
+    dx0 = x0 - xs + r
+    dx1 = x1 - xs + r
+    dy0 = y0 - ys + r
+    dy1 = y1 - ys + r
+    bounds = np.stack((x0, x1, y0, y1, dx0, dx1, dy0, dy1), axis=1).tolist()
+    for x0, x1, y0, y1, dx0, dx1, dy0, dy1 in bounds:
+        window = inflated[y0:y1, x0:x1]
+        window |= disk[dy0:dy1, dx0:dx1]
+
+
 class ObstacleInflator:
     """
     Inflates obstacles to account for the robot's physical size.
@@ -30,31 +152,23 @@ class ObstacleInflator:
         self.robot_radius = robot_radius
         self.obstacles = None
 
-    def distance(self, obs_x, obs_y, wx, wy):
-        """
-        Calculate Euclidean distance between two points in world coordinates.
-        
-        Args:
-            obs_x, obs_y: First point coordinates
-            wx, wy: Second point coordinates
-            
-        Returns:
-            Euclidean distance between the points
-        """
-        return math.sqrt((obs_x - wx)**2 + (obs_y - wy)**2)
-
     def inflate(self, grid_map, world_map, obstacles):
         """
         Inflate obstacles by marking nearby cells as blocked.
         
-        For each free cell in the grid, check if it's within the robot's radius
-        of any obstacle. If so, mark it as inflated (blocked). This ensures
-        the robot can safely navigate through the environment.
+        A free cell is inflated (blocked) if its center is within the robot's
+        radius of any obstacle. The cell offsets that satisfy this are computed
+        once as a footprint. With few obstacles the footprint is OR-ed into
+        each obstacle's bounding box; on sparse maps it is stamped around all
+        obstacles one offset at a time; otherwise the obstacle mask is dilated
+        with it in a few whole-grid array passes. All give the same result.
+        This ensures the robot can safely navigate through the environment.
         
         Args:
             grid_map: GridMap to mark inflated cells in
             world_map: WorldMap for coordinate conversions
-            obstacles: List of Obstacle objects to inflate around
+            obstacles: Obstacles to inflate around, either as an (N, 2) integer
+                array of (gx, gy) rows or as a list of Obstacle objects
         """
         self.grid_map = grid_map
         self.world_map = world_map
@@ -64,24 +178,34 @@ class ObstacleInflator:
 
         # Initialize the inflated grid if not already done
         self.grid_map.init_inflation()
-        
-        # Check every cell in the grid
-        for gy in range(grid_map.height):
-            for gx in range(grid_map.width):
-                # Skip cells that are already obstacles
-                if self.grid_map.is_obstacle(gx, gy):
-                    continue
-
-                # Get the world coordinates of this cell's center
-                wx, wy = self.world_map.grid_to_world(gx, gy)
-
-                # Check distance to all obstacles
-                for obstacle in self.obstacles:
-                    # Get obstacle center in world coordinates
-                    obs_wx, obs_wy = self.world_map.grid_to_world(obstacle.gx, obstacle.gy)
-                    # Calculate distance between cell center and obstacle center
-                    ds = self.distance(obs_wx, obs_wy, wx, wy)
-                    # If too close, mark as inflated (blocked)
-                    if ds < self.robot_radius + obstacle_radius:
-                        self.grid_map.mark_inflated(gx, gy)
-                        break  # No need to check other obstacles for this cell
\ No newline at end of file
+
+        # Obstacle grid coordinates as flat arrays
+        if isinstance(obstacles, np.ndarray):
+            xs, ys = obstacles[:, 0], obstacles[:, 1]
+        else:
+            xs = np.fromiter((o.gx for o in obstacles), dtype=np.int32, count=len(obstacles))
+            ys = np.fromiter((o.gy for o in obstacles), dtype=np.int32, count=len(obstacles))
+
+        # Footprint: cell offsets whose center is closer than
+        # robot_radius + obstacle_radius to an obstacle center
+        reach = self.robot_radius + obstacle_radius
+        disk, fdxs, fdys = footprint(reach, self.world_map.resolution)
+
+        shape = (self.grid_map.height, self.grid_map.width)
+        if len(xs) < 4 * len(fdxs):
+            # Few obstacles for the footprint size: one window per obstacle
+            inflated = np.zeros(shape, dtype=bool)
+            stamp_windows(inflated, xs, ys, disk)
+        elif len(xs) < SPARSE_OBSTACLE_DENSITY * shape[0] * shape[1]:
+            # Sparse map: stamp the footprint around all obstacles per offset
+            inflated = np.zeros(shape, dtype=bool)
+            stamp(inflated, xs, ys, fdxs, fdys)
+        else:
+            # Dilate the obstacle mask with the footprint
+            obstacle_mask = np.zeros(shape, dtype=bool)
+            obstacle_mask[ys, xs] = True
+            inflated = dilate(obstacle_mask, fdxs, fdys)
+
+        # Cells that are obstacles themselves are not marked as inflated
+        inflated[self.grid_map.grid == 1] = False
+        self.grid_map.mark_inflated_bulk(inflated)
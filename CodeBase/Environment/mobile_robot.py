@@ -18,6 +18,7 @@ class MobileRobot:
     actual navigation and visualization). The robot knows its start and
     goal positions and can convert between coordinate systems.
     """
+    __slots__ = ("radius", "sx", "sy", "gx", "gy", "x", "y", "grid_map", "world_map")
 
     def __init__(self, radius, start_grid, goal_grid):
         """
@@ -14,6 +14,9 @@ class Obstacle:
     required. World coordinates (wx, wy) are optional and can be computed
     from grid coordinates when needed.
     """
+    # Fixed attributes: no per-instance __dict__, which matters when a map
+    # is turned into thousands of Obstacle objects
+    __slots__ = ("gx", "gy", "wx", "wy")
 
     def __init__(self, gx, gy, wx=None, wy=None):
         """
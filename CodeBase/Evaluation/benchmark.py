@@ -0,0 +1,132 @@
+"""
+Benchmark - Headless Planner Timing
+
+This module runs every planner on freshly generated random maps without any
+GUI or plotting, so the measured numbers contain only the algorithm cost.
+Results are printed and can be written to a CSV file for later analysis.
+
+Usage (from the project root):
+
+    python -m CodeBase.Evaluation.benchmark [results.csv]
+
+Set BENCH_SEED to make the generated maps reproducible.
+"""
+
+import csv
+import sys
+
+from CodeBase.Evaluation.run_on_map import run_planners_parallel
+from CodeBase.Util.random_grid_factory import create_random_grid_environment
+
+
+# (planner, use_tree_search) pairs, same set as the experiment GUI offers
+PLANNERS = [
+    ("Astar", False), ("BFS", False), ("DFS", False),
+    ("Astar", True), ("BFS", True), ("DFS", True),
+    ("BiBFS", False),
+]
+
+# Columns of the CSV written by run_and_bench
+RESULT_FIELDS = [
+    "size", "map_index", "planner", "tree", "motion", "found",
+    "path_len", "path_cost", "expanded_nodes", "runtime_ms", "memory_kb",
+]
+
+
+def run_and_bench(
+    sizes=(10, 50, 100),
+    maps_per_size=5,
+    obstacle_ratio=0.2,
+    robot_radius=0.5,
+    resolution=1.0,
+    motion="8n",
+    max_expansions=50000,
+    csv_path=None,
+    max_workers=1,
+    measure_memory=True,
+):
+    """
+    Time all planners on random maps and collect one result row per run.
+
+    Parameters
+    ----------
+    sizes : tuple[int]
+        Grid sizes to generate (size x size cells)
+    maps_per_size : int
+        Number of random maps per size
+    obstacle_ratio, robot_radius, resolution : float
+        Map generation settings, as in create_random_grid_environment
+    motion : str
+        "4n" or "8n"
+    max_expansions : int
+        Expansion limit for the tree-based planners
+    csv_path : str, optional
+        If given, the rows are also written to this CSV file
+    max_workers : int or None, optional
+        Worker processes passed to run_planners_parallel (default 1, so
+        runtimes are measured without jobs competing for cores)
+    measure_memory : bool, optional
+        If False, skip the extra tracemalloc run per job and leave
+        memory_kb empty, which roughly halves the benchmark time
+
+    Returns
+    -------
+    list[dict]
+        One dict per (map, planner) run with the RESULT_FIELDS keys
+    """
+    jobs = []
+    job_maps = []
+    for size in sizes:
+        for i in range(maps_per_size):
+            grid_map, world_map, robot, obstacles = create_random_grid_environment(
+                size=size,
+                obstacle_ratio=obstacle_ratio,
+                robot_radius=robot_radius,
+                resolution=resolution
+            )
+            env = {
+                "grid_map": grid_map,
+                "world_map": world_map,
+                "robot": robot,
+                "obstacles": obstacles,
+                "start": (robot.sx, robot.sy),
+                "goal": (robot.gx, robot.gy),
+            }
+            for planner_name, use_tree_search in PLANNERS:
+                exec_cfg = {
+                    "planner": planner_name,
+                    "motion": motion,
+                    "use_tree_search": use_tree_search,
+                    "max_expansions": max_expansions,
+                    "measure_memory": measure_memory,
+                }
+                jobs.append((env, exec_cfg))
+                job_maps.append((size, i))
+
+    rows = []
+    for (size, i), result in zip(job_maps, run_planners_parallel(jobs, max_workers, chunksize=len(PLANNERS))):
+        row = {"size": size, "map_index": i}
+        for field in RESULT_FIELDS[2:]:
+            row[field] = result[field]
+        rows.append(row)
+
+    print("\n[BENCH] size map planner      runtime_ms  expanded  found")
+    for row in rows:
+        label = f"{row['planner']}-{'Tree' if row['tree'] else 'Graph'}"
+        print(
+            f"[BENCH] {row['size']:>4} {row['map_index']:>3} {label:<12}"
+            f"{row['runtime_ms']:>10.2f} {row['expanded_nodes']:>9} {row['found']!s:>6}"
+        )
+
+    if csv_path:
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"[BENCH] Results written to {csv_path}")
+
+    return rows
+
+
+if __name__ == "__main__":
+    run_and_bench(csv_path=sys.argv[1] if len(sys.argv) > 1 else None)
@@ -6,9 +6,18 @@ This module provides functionality to run path planning algorithms headlessly
 including runtime, memory usage, path length, and node expansions.
 """
 
+import multiprocessing
+import os
 import time
 import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 from CodeBase.navigation_system import NavigationSystem
+from CodeBase.Search.planner import free_move_table, heuristic_table
+
+
+# Thread pool sizes of numpy's native libraries, pinned to 1 in worker
+# processes so N workers don't each start one thread per core
+WORKER_THREAD_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
 
 
 def run_planner_on_map(env_data, exec_config):
@@ -22,17 +31,30 @@ def run_planner_on_map(env_data, exec_config):
             "grid_map": GridMap,
             "world_map": WorldMap,
             "robot": MobileRobot,
-            "obstacles": list[Obstacle]
+            "obstacles": np.ndarray  # (N, 2) obstacle (gx, gy) coordinates
         }
 
     exec_config : dict
         {
-            "planner": "Astar" | "BFS" | "DFS",
+            "planner": "Astar" | "BFS" | "DFS" | "BiBFS",
             "motion": "4n" | "8n",
             "use_tree_search": bool,
             "visualize_search": False,
-            "navigation_mode": "batch" | "single"
+            "navigation_mode": "batch" | "single",
+            "measure_memory": bool  # optional, default True
         }
+
+    Notes
+    -----
+    Peak memory is measured with tracemalloc in a second, untimed run on a
+    copy of the map, so runtime_ms is never slowed by its allocation hooks.
+    Set "measure_memory" to False to skip that run; memory_kb is then None.
+
+    The A* heuristic table and the free-neighbor table of the map are
+    built before the timed run. Both are cached per map and shared by the
+    planners run on it, so they would otherwise be charged to whichever
+    planner runs first. The map copy of the memory run gets its table
+    before tracemalloc starts, so neither table counts towards memory_kb.
     """
 
     # Force headless + batch-safe defaults
@@ -46,29 +68,53 @@ def run_planner_on_map(env_data, exec_config):
         visualizer=None
     )
 
-    tracemalloc.start()
+    if nav.planner_name == "ASTAR":
+        grid_map = env_data["grid_map"]
+        robot = env_data["robot"]
+        gx, gy = env_data.get("goal", (robot.gx, robot.gy))
+        heuristic_table(grid_map.width, grid_map.height, (gx, gy), grid_map.resolution, nav.motion)
+    free_move_table(env_data["grid_map"], nav.motion)
 
+    # Timed run: tracemalloc stays off so its per-allocation hooks
+    # don't inflate the measured runtime
     start_time = time.perf_counter()
-    path = nav.run()
+    nav.run()
     end_time = time.perf_counter()
-    
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+
+    # Memory run: repeat the search on a fresh map copy with tracemalloc on
+    memory_kb = None
+    if exec_config.get("measure_memory", True):
+        mem_env = dict(env_data)
+        mem_env["grid_map"] = env_data["grid_map"].clone()
+        mem_nav = NavigationSystem(
+            env_data=mem_env,
+            exec_config=exec_config,
+            visualizer=None
+        )
+        # The copy starts with an empty table cache; build it untraced so
+        # it is excluded like the heuristic table of the timed run
+        free_move_table(mem_env["grid_map"], nav.motion)
+
+        tracemalloc.start()
+        mem_nav.run()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory_kb = peak / 1024.0
 
     planner = nav.planner
+    plan = nav.result
+    path = plan.path
 
     # ---- metrics ----
-    found = path is not None
+    found = plan.reached_goal
     path_len = len(path) if found else 0
 
+    # Only the A* planners define step costs
     if found and hasattr(planner, "cost"):
-        path_cost = sum(
-            planner.cost(*p1, *p2)
-            for p1, p2 in zip(path[:-1], path[1:])
-        )
+        path_cost = planner.path_cost(path)
     else:
         path_cost = float("inf")
-    
+
     return {
         "planner": exec_config["planner"],
         "tree": exec_config["use_tree_search"],
@@ -79,9 +125,75 @@ def run_planner_on_map(env_data, exec_config):
         "path_cost": path_cost,
         "path": path,
 
-        "expanded_nodes": getattr(planner, "expanded_count", 0),
+        "expanded_nodes": plan.expanded_count,
         "runtime_ms": (end_time - start_time) * 1000.0,
-        "memory_kb": peak / 1024.0,
+        "memory_kb": memory_kb,
 
-        "expansion_map": getattr(planner, "expansion_map", {}),
+        # Expansion statistics as SoA arrays (compact to pickle and to scatter)
+        "expansion_xs": plan.expansion_xs,
+        "expansion_ys": plan.expansion_ys,
+        "expansion_counts": plan.expansion_counts,
     }
+
+
+def _run_job(job):
+    """Worker entry point: unpack one (env_data, exec_config) job."""
+    env_data, exec_config = job
+    return run_planner_on_map(env_data, exec_config)
+
+
+def run_planners_parallel(jobs, max_workers=1, chunksize=1):
+    """
+    Run several headless planner jobs, optionally in parallel worker processes.
+
+    Every (map, planner) run is an independent CPU-bound search, so running
+    them in separate processes sidesteps the GIL. Environments are pickled
+    into the workers; planners are deterministic, so paths and expansion
+    counts match a sequential run.
+
+    Parallelism is opt-in because concurrent jobs compete for cores, caches
+    and turbo headroom: with max_workers > 1 the reported runtime_ms values
+    are higher and noisier than in a sequential run and should not be
+    compared with one. Workers are started with the "spawn" method, since
+    callers such as the experiment GUI run this from a thread of a
+    multi-threaded process, where fork can deadlock on inherited locks.
+    Each worker is limited to one native numpy thread (WORKER_THREAD_VARS)
+    unless the caller has set those variables, to avoid oversubscription.
+
+    Parameters
+    ----------
+    jobs : list[tuple[dict, dict]]
+        (env_data, exec_config) pairs, as accepted by run_planner_on_map
+    max_workers : int or None, optional
+        Number of worker processes. The default of 1 runs the jobs one after
+        another in this process; None uses os.cpu_count() workers.
+    chunksize : int, optional
+        Number of consecutive jobs sent to a worker at once. Jobs of one
+        chunk are pickled together, so an environment shared by several
+        jobs (e.g. one map run with every planner) is sent only once.
+
+    Yields
+    ------
+    dict
+        Result of run_planner_on_map for each job, in the order of jobs
+    """
+    if max_workers == 1:
+        for job in jobs:
+            yield _run_job(job)
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count()
+
+    # Spawned workers copy os.environ when they start, which happens
+    # inside the pool block; restore the parent's environment afterwards
+    unset = [var for var in WORKER_THREAD_VARS if var not in os.environ]
+    for var in unset:
+        os.environ[var] = "1"
+    try:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            yield from executor.map(_run_job, jobs, chunksize=chunksize)
+    finally:
+        for var in unset:
+            os.environ.pop(var, None)
@@ -10,11 +10,26 @@ heatmaps and paths.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import os
+import tempfile
 import threading
+from collections import deque
 import numpy as np
-from CodeBase.Util.heatmap_utils import expansion_map_to_array
-
-from CodeBase.Evaluation.run_on_map import run_planner_on_map
+import pandas as pd
+from numpy.random import SeedSequence, default_rng
+# Set backend before importing pyplot to avoid compatibility issues
+import matplotlib
+try:
+    matplotlib.use('TkAgg')
+except Exception:
+    pass  # Backend might already be set
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.colors import ListedColormap, BoundaryNorm
+from matplotlib.figure import Figure
+from CodeBase.Util.heatmap_utils import save_expansions, load_heatmap, load_grid_path
+
+from CodeBase.Evaluation.run_on_map import run_planners_parallel
 from CodeBase.Util.random_grid_factory import create_random_grid_environment
 
 
@@ -32,6 +47,47 @@ class ExperimentGUI(tk.Toplevel):
     tables, comparison plots, and heatmap visualization. Experiments run
     in a separate thread to keep the UI responsive.
     """
+
+    # Columns of the results table and of the exported CSV
+    RESULT_COLUMNS = ("Planner", "Mode", "Map Size", "Map ID", "Runtime (ms)",
+                      "Expanded Nodes", "Path Length", "Path Cost", "Memory (KB)", "Found", "Status")
+
+    # Planner checkbox label -> (planner, use_tree_search), in run order
+    _PLANNER_DEFS = (
+        ("BFS Graph", "BFS", False),
+        ("DFS Graph", "DFS", False),
+        ("A* Graph", "Astar", False),
+        ("BFS Tree", "BFS", True),
+        ("DFS Tree", "DFS", True),
+        ("A* Tree", "Astar", True),
+        ("BiBFS Graph", "BiBFS", False),
+    )
+
+    # Box color per planner_label in the per-size comparison, spread over
+    # Set3 in label order once, so a planner has the same color in every panel
+    _PLANNER_COLORS = dict(zip(
+        sorted(f"{planner}-{'Tree' if tree else 'Graph'}" for _, planner, tree in _PLANNER_DEFS),
+        plt.cm.Set3(np.linspace(0, 1, len(_PLANNER_DEFS))),
+    ))
+
+    # Improved colormap: white for unvisited, then clear gradient from visible color
+    # Free cells stay white, but exploration is immediately visible.
+    # Built once and shared by every heatmap panel and the colorbar
+    _HEATMAP_COLORS = (
+        "black",        # -1 => obstacle (keep black for obstacles)
+        "#ffffff",      # 0  => unvisited (white - matches free cells)
+        "#b3d9ff",      # 1-5 => light blue (clearly visible, not white)
+        "#66b3ff",      # 5-10 => medium blue (light exploration)
+        "#1a8cff",      # 10-20 => blue (moderate exploration)
+        "#00cc66",      # 20-50 => green (increasing exploration)
+        "#ffcc00",      # 50-200 => yellow/orange (high exploration)
+        "#ff6600",      # 200+ => bright orange-red (maximum exploration)
+    )
+    _HEATMAP_BOUNDS = (-1, 0, 1, 5, 10, 20, 50, 200, 1_000_000)
+    _HEATMAP_CMAP = ListedColormap(_HEATMAP_COLORS)
+    _HEATMAP_NORM = BoundaryNorm(_HEATMAP_BOUNDS, len(_HEATMAP_COLORS))
+    _HEATMAP_MAPPABLE = plt.cm.ScalarMappable(cmap=_HEATMAP_CMAP, norm=_HEATMAP_NORM)
+
     def __init__(self, parent):
         """
         Initialize the experiment GUI window.
@@ -48,12 +104,30 @@ class ExperimentGUI(tk.Toplevel):
 
         self.maps = {}       # size -> list[env_data]
         self.results = []    # list[dict]
+        self._result_rows = []  # formatted RESULT_COLUMNS row per result
+        # (map_id, planner, tree, motion, max_expansions) -> result already
+        # in self.results, so repeated runs skip jobs they have done
+        self._result_cache = {}
+        self._results_df = None  # cached DataFrame of results (see _results_frame)
         self._is_running = False
-        self.heatmaps = {}   # heatmap_id -> np.ndarray
-        self.grids = {}     # map_id -> np.ndarray
-        self.starts = {}
-        self.goals = {}
-        self.paths = {}
+        # Worker thread -> UI hand-off, polled in batches by _tick_ui
+        self._log_queue = deque()
+        self._progress_value = 0
+        self._worker = None  # experiment thread while it runs
+        # Pending after() ids of debounced table / plot refreshes
+        self._table_pending = None
+        self._plot_pending = None
+        self._debug = False  # log per-job heatmap stats while running
+        self.heatmaps = {}   # heatmap_id -> .npz file with the heatmap and found path
+        self._heatmap_dir = None  # TemporaryDirectory holding the heatmap files
+        self._heat_scratch = {}  # (height, width) -> reusable int16 heatmap buffer
+        self._heatmap_artists = None  # artists of the shown heatmap panels, for reuse
+        self._plot_axes = None  # (view, rows, cols) and axes grid on the figure, for reuse
+        self.grids = {}     # map_id -> occupancy array (nonzero = blocked)
+        self.map_ids = []   # row -> map_id for the stacked start/goal arrays
+        self._map_row = {}  # map_id -> row in self.starts / self.goals
+        self.starts = np.empty((0, 2), dtype=np.int32)
+        self.goals = np.empty((0, 2), dtype=np.int32)
         
         # Navigation state for heatmap view
         self.current_heatmap_map_idx = 0
@@ -107,6 +181,12 @@ class ExperimentGUI(tk.Toplevel):
         self.max_expansions.pack(fill="x")
         ttk.Label(left, text="Limit for tree-based algorithms", font=("Arial", 8)).pack(anchor="w", pady=(2, 0))
 
+        ttk.Label(left, text="Worker Processes").pack(anchor="w", pady=(6, 0))
+        self.max_workers = ttk.Entry(left)
+        self.max_workers.insert(0, "1")
+        self.max_workers.pack(fill="x")
+        ttk.Label(left, text="1 = sequential; more is faster but skews runtimes", font=("Arial", 8)).pack(anchor="w", pady=(2, 0))
+
         ttk.Label(left, text="Motion Model").pack(anchor="w", pady=(6, 0))
         self.motion = ttk.Combobox(left, values=["4n", "8n"], state="readonly")
         self.motion.current(0)
@@ -129,6 +209,7 @@ class ExperimentGUI(tk.Toplevel):
             "BFS Tree": tk.BooleanVar(value=False),
             "DFS Tree": tk.BooleanVar(value=False),
             "A* Tree": tk.BooleanVar(value=False),
+            "BiBFS Graph": tk.BooleanVar(value=False),
         }
 
         for k, v in self.planners.items():
@@ -192,8 +273,22 @@ class ExperimentGUI(tk.Toplevel):
         self.log.see("end")
 
     def log_msg_async(self, msg: str):
-        # Safe from any thread
-        self.after(0, lambda: self.log_msg(msg))
+        # Safe from any thread: only queued (no Tk call), _tick_ui writes it
+        self._log_queue.append(msg)
+
+    def _tick_ui(self):
+        # UI thread, every 100 ms while the experiment runs: apply queued
+        # log lines and the latest progress at once. Check the worker
+        # first, so lines queued just before it ended are still flushed.
+        alive = self._worker is not None and self._worker.is_alive()
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if lines:
+            self.log_msg("\n".join(lines))
+        self._update_progress(self._progress_value)
+        if alive:
+            self.after(100, self._tick_ui)
 
     def _set_running_ui(self, running: bool):
         def apply():
@@ -214,19 +309,28 @@ class ExperimentGUI(tk.Toplevel):
         # reset experiment state
         self.maps.clear()
         self.results.clear()
+        self._result_rows.clear()
+        self._result_cache.clear()
+        self._results_df = None
 
-        # storage for NPZ export (one-time per map)
+        # static per-map data (one-time per map)
         self.grids = {}
-        self.starts = {}
-        self.goals = {}
+        self.map_ids = []
+        self._map_row = {}
+        start_list = []
+        goal_list = []
         self.heatmaps = {}
 
+        # Heatmaps are written to disk as they are computed; replacing the
+        # directory object deletes the files of the previous experiment
+        self._heatmap_dir = tempfile.TemporaryDirectory(prefix="heatmaps_")
+
         try:
             obstacle_ratio = float(self.obstacle_ratio.get())
             robot_radius = float(self.robot_radius.get())
             resolution = float(self.resolution.get())
 
-            seed_txt = self.seed_entry.get().strip() if hasattr(self, "seed_entry") else ""
+            seed_txt = self.seed_entry.get().strip()
             base_seed = int(seed_txt) if seed_txt else None
 
         except Exception as e:
@@ -245,43 +349,47 @@ class ExperimentGUI(tk.Toplevel):
 
         self.log_msg("[MAP GEN] Generating maps...")
 
-        for name, size, count, enabled in config:
+        # Independent, reproducible random stream per (size, map index):
+        # one child seed sequence per size, spawned over all sizes so a
+        # map's seed does not depend on which sizes are enabled
+        size_seeds = SeedSequence(base_seed).spawn(len(config)) if base_seed is not None else None
+
+        for k, (name, size, count, enabled) in enumerate(config):
             if not enabled:
                 continue
 
+            map_seeds = size_seeds[k].spawn(count) if size_seeds else None
+
             self.maps[name] = []
             success = 0
             skipped = 0
 
             for i in range(count):
 
-                # deterministic per-map seed
-                if base_seed is not None:
-                    import random, numpy as np
-                    s = base_seed + (hash(name) % 10_000) + i * 97
-                    random.seed(s)
-                    np.random.seed(s % (2**32 - 1))
+                # deterministic per-map generator (module generator if unseeded)
+                rng = default_rng(map_seeds[i]) if map_seeds else None
 
                 try:
                     grid_map, world_map, robot, obstacles = create_random_grid_environment(
                         size=size,
                         obstacle_ratio=obstacle_ratio,
                         robot_radius=robot_radius,
-                        resolution=resolution
+                        resolution=resolution,
+                        rng=rng
                     )
 
                     # unique map id (stable across planners)
                     map_id = f"{name}_{i}"
 
                     # ---- STORE STATIC MAP DATA (ONCE) ----
-                    # Combine original obstacles + inflated obstacles for accurate visualization
-                    combined_obstacles = grid_map.grid.copy().astype(float)
-                    if grid_map.inflated_grid is not None:
-                        # Mark inflated cells as obstacles (value 1) so they show as black
-                        combined_obstacles[grid_map.inflated_grid] = 1
-                    self.grids[map_id] = combined_obstacles
-                    self.starts[map_id] = (robot.sx, robot.sy)
-                    self.goals[map_id] = (robot.gx, robot.gy)
+                    # Packed occupancy is nonzero for obstacles and inflated
+                    # cells alike, so the heatmap view can shade both black.
+                    # Shared with the env's grid_map rather than copied.
+                    self.grids[map_id] = grid_map.occ
+                    self._map_row[map_id] = len(self.map_ids)
+                    self.map_ids.append(map_id)
+                    start_list.append((robot.sx, robot.sy))
+                    goal_list.append((robot.gx, robot.gy))
 
                     # ---- ENV DATA FOR PLANNERS ----
                     env = {
@@ -298,6 +406,8 @@ class ExperimentGUI(tk.Toplevel):
                             "map_id": map_id,
                             "size_name": name,
                             "size": size,
+                            "width": grid_map.width,
+                            "height": grid_map.height,
                             "map_index": i,
                             "obstacle_ratio": obstacle_ratio,
                             "robot_radius": robot_radius,
@@ -318,6 +428,10 @@ class ExperimentGUI(tk.Toplevel):
                 f"{success}/{count} generated, {skipped} skipped"
             )
 
+        # one (N, 2) array each instead of a tuple per map
+        self.starts = np.array(start_list, dtype=np.int32).reshape(-1, 2)
+        self.goals = np.array(goal_list, dtype=np.int32).reshape(-1, 2)
+
         self.log_msg("[DONE] Map generation complete ✅")
 
 
@@ -339,26 +453,13 @@ class ExperimentGUI(tk.Toplevel):
             return
 
         self._set_running_ui(True)
-        threading.Thread(target=self._run_experiment_thread, args=(planner_defs,), daemon=True).start()
+        self._worker = threading.Thread(target=self._run_experiment_thread, args=(planner_defs,), daemon=True)
+        self._worker.start()
+        self.after(100, self._tick_ui)
 
     def _selected_planners(self):
-        selected = []
-
-        # matches your pipeline: planner + use_tree_search
-        if self.planners["BFS Graph"].get():
-            selected.append(("BFS", False))
-        if self.planners["DFS Graph"].get():
-            selected.append(("DFS", False))
-        if self.planners["A* Graph"].get():
-            selected.append(("Astar", False))    
-        if self.planners["BFS Tree"].get():
-            selected.append(("BFS", True))
-        if self.planners["DFS Tree"].get():
-            selected.append(("DFS", True))
-        if self.planners["A* Tree"].get():
-            selected.append(("Astar", True)) 
-
-        return selected
+        # (planner, use_tree_search) pairs matching your pipeline
+        return [(name, tree) for key, name, tree in self._PLANNER_DEFS if self.planners[key].get()]
 
     def _run_experiment_thread(self, planner_defs):
         try:
@@ -368,19 +469,24 @@ class ExperimentGUI(tk.Toplevel):
             except ValueError:
                 max_expansions = 50000  # Default if invalid input
                 self.log_msg_async(f"[WARNING] Invalid max_expansions, using default: {max_expansions}")
-
-            total_jobs = sum(len(envs) for envs in self.maps.values()) * len(planner_defs)
-            self.after(0, lambda: self._init_progress(total_jobs))
-
-            job = 0
-
+            try:
+                max_workers = max(1, int(self.max_workers.get()))
+            except ValueError:
+                max_workers = 1  # Sequential if invalid input
+                self.log_msg_async("[WARNING] Invalid worker count, running sequentially")
+
+            # ---- BUILD JOB LIST (one job per map x planner) ----
+            # Jobs run earlier on these maps with the same settings are
+            # skipped: their results are already in the table
+            jobs = []
+            cached = 0
             for size_name, envs in self.maps.items():
                 for mid, env_data in enumerate(envs):
-
-                    # stable map id (matches generate_maps)
-                    map_id = env_data["meta"]["map_id"]
-
                     for planner_name, use_tree_search in planner_defs:
+                        key = (env_data["meta"]["map_id"], planner_name, use_tree_search, motion, max_expansions)
+                        if key in self._result_cache:
+                            cached += 1
+                            continue
                         exec_cfg = {
                             "planner": planner_name,
                             "motion": motion,
@@ -389,83 +495,117 @@ class ExperimentGUI(tk.Toplevel):
                             "navigation_mode": "batch",
                             "max_expansions": max_expansions,
                         }
+                        jobs.append((size_name, mid, env_data, exec_cfg))
 
-                        # ---- RUN PLANNER ----
-                        result = run_planner_on_map(env_data, exec_cfg)
+            if cached:
+                self.log_msg_async(f"[CACHE] Skipping {cached} job(s) already run on these maps")
 
-                        # capture paths
-
-                        path = result.pop("path", None)
-
-                        path_id = (
-                            f"{map_id}_{planner_name}_{use_tree_search}_{motion}"
-                        )
-
-                        if path is not None:
-                            self.paths[path_id] = path
+            total_jobs = len(jobs)
+            self._progress_value = 0
+            self.after(0, lambda: self._init_progress(total_jobs))
 
-                        # ---- HEATMAP CAPTURE ----
-                        grid_map = env_data["grid_map"]
-                        width, height = grid_map.width, grid_map.height
+            # ---- RUN PLANNERS ----
+            # One job at a time by default so runtime_ms stays comparable
+            # between runs; more workers spread the jobs over processes,
+            # one map (with all its planners) per chunk so each map is
+            # pickled into a worker once
+            results = run_planners_parallel(
+                [(env_data, exec_cfg) for _, _, env_data, exec_cfg in jobs],
+                max_workers=max_workers,
+                chunksize=len(planner_defs)
+            )
 
-                        heatmap = expansion_map_to_array(
-                            result.get("expansion_map", {}),
-                            width,
-                            height
-                        )
+            job = 0
 
-                        # debug code 
+            for (size_name, mid, env_data, exec_cfg), result in zip(jobs, results):
 
-                        nonzero = np.count_nonzero(heatmap)
-                        maxval = heatmap.max()
+                # stable map id (matches generate_maps)
+                meta = env_data["meta"]
+                map_id = meta["map_id"]
+                planner_name = exec_cfg["planner"]
+                use_tree_search = exec_cfg["use_tree_search"]
 
-                        self.log_msg_async(
-                            f"[DEBUG] heatmap nonzero={nonzero}, max={maxval}"
-                        )
-                        # end debug code
+                # capture paths (written to the heatmap file below)
 
+                path = result.pop("path", None)
 
-                        heatmap_id = (
-                            f"{map_id}_{planner_name}_{use_tree_search}_{motion}"
-                        )
+                # ---- HEATMAP CAPTURE ----
+                width, height = meta["width"], meta["height"]
 
-                        self.heatmaps[heatmap_id] = heatmap
+                # Expansion arrays list each expanded cell once, so they
+                # are already the sparse heatmap. Take them out of the
+                # result so stored results don't grow with the map size
+                xs = result.pop("expansion_xs", ())
+                ys = result.pop("expansion_ys", ())
+                counts = np.asarray(result.pop("expansion_counts", ()), dtype=np.int32)
 
-                        # ---- FLATTEN RESULT FOR CSV ----
-                        result.pop("heatmap", None)          # remove dict
-                        result["heatmap_id"] = heatmap_id   # reference only
+                # debug code 
+                if self._debug:
+                    maxval = counts.max(initial=0)
+                    nonzero = np.count_nonzero(counts) if maxval else 0
 
-                        # metadata (CSV-safe)
-                        result["map_size"] = size_name
-                        result["map_id"] = mid
-                        result["planner"] = planner_name
-                        result["tree"] = use_tree_search
-                        result["motion"] = motion
-                        result["max_expansions"] = max_expansions  # Store limit for status detection
+                    self.log_msg_async(
+                        f"[DEBUG] heatmap nonzero={nonzero}, max={maxval}"
+                    )
+                # end debug code
 
-                        self.results.append(result)
 
-                        job += 1
-                        self.after(0, lambda v=job: self._update_progress(v))
+                heatmap_id = (
+                    f"{map_id}_{planner_name}_{use_tree_search}_{motion}"
+                )
 
-                        # Check if limit was reached
-                        expanded = result.get("expanded_nodes", 0)
-                        limit_reached = max_expansions > 0 and expanded >= max_expansions and not result.get("found", False)
-                        limit_msg = " [LIMIT REACHED]" if limit_reached else ""
-                        
-                        self.log_msg_async(
-                            f"{size_name} map {mid} | {planner_name} "
-                            f"{'Tree' if use_tree_search else 'Graph'} | "
-                            f"time={result.get('runtime_ms', -1):.1f}ms "
-                            f"exp={result.get('expanded_nodes', 'NA')} "
-                            f"path={result.get('path_len', 'NA')}{limit_msg}"
-                        )
+                # Keep only a file reference so memory does not grow with
+                # the number of (map, planner) runs; the path goes along
+                # Counts are saved saturated at 255 (uint8): the heatmap
+                # view draws everything above its top bound (200) alike
+                heatmap_path = os.path.join(self._heatmap_dir.name, f"{heatmap_id}.npz")
+                counts = np.minimum(counts, np.iinfo(np.uint8).max).astype(np.uint8)
+                save_expansions(heatmap_path, xs, ys, counts, width, height, grid_path=path)
+                self.heatmaps[heatmap_id] = heatmap_path
+
+                # Everything is on disk now; free the arrays before the
+                # next job instead of when the names are rebound
+                del xs, ys, counts, path
+
+                # ---- FLATTEN RESULT FOR CSV ----
+                result["heatmap_id"] = heatmap_id   # reference only
+
+                # metadata (CSV-safe)
+                result["map_size"] = size_name
+                result["map_id"] = mid
+                result["planner"] = planner_name
+                result["tree"] = use_tree_search
+                result["motion"] = motion
+                result["max_expansions"] = max_expansions  # Store limit for status detection
+
+                self.results.append(result)
+                self._result_rows.append(self._format_result_row(result))
+                self._result_cache[(map_id, planner_name, use_tree_search, motion, max_expansions)] = result
+
+                job += 1
+                self._progress_value = job
+
+                # Check if limit was reached
+                expanded = result.get("expanded_nodes", 0)
+                limit_reached = max_expansions > 0 and expanded >= max_expansions and not result.get("found", False)
+                limit_msg = " [LIMIT REACHED]" if limit_reached else ""
+                
+                self.log_msg_async(
+                    f"{size_name} map {mid} | {planner_name} "
+                    f"{'Tree' if use_tree_search else 'Graph'} | "
+                    f"time={result.get('runtime_ms', -1):.1f}ms "
+                    f"exp={result.get('expanded_nodes', 'NA')} "
+                    f"path={result.get('path_len', 'NA')}{limit_msg}"
+                )
 
             self.log_msg_async("[DONE] Experiment complete")
             
             # Update all views
             self.after(0, self._update_table)
-            self.after(0, self._update_plot)
+            # BENCH_NO_PLOT skips the automatic redraw so timing-focused runs
+            # don't pay for matplotlib; plots still draw on demand
+            if not os.environ.get("BENCH_NO_PLOT"):
+                self.after(0, self._update_plot)
             self.after(0, self._update_stats)
 
         except Exception as e:
@@ -480,8 +620,9 @@ class ExperimentGUI(tk.Toplevel):
         self.progress["maximum"] = max(1, total_jobs)
 
     def _update_progress(self, value: int):
+        # no update_idletasks(): called from the mainloop tick, so Tk
+        # redraws the bar on its next idle pass anyway
         self.progress["value"] = value
-        self.update_idletasks()
 
     
     # --------------------------------------------------
@@ -498,13 +639,13 @@ class ExperimentGUI(tk.Toplevel):
         self.filter_planner = ttk.Combobox(toolbar, values=["All"], state="readonly", width=12)
         self.filter_planner.current(0)
         self.filter_planner.pack(side="left", padx=5)
-        self.filter_planner.bind("<<ComboboxSelected>>", lambda e: self._update_table())
+        self.filter_planner.bind("<<ComboboxSelected>>", lambda e: self._request_table_update())
         
         self.filter_size = ttk.Combobox(toolbar, values=["All", "small", "medium", "large"], 
                                         state="readonly", width=12)
         self.filter_size.current(0)
         self.filter_size.pack(side="left", padx=5)
-        self.filter_size.bind("<<ComboboxSelected>>", lambda e: self._update_table())
+        self.filter_size.bind("<<ComboboxSelected>>", lambda e: self._request_table_update())
         
         ttk.Button(toolbar, text="Refresh", command=self._update_table).pack(side="left", padx=5)
         
@@ -515,8 +656,7 @@ class ExperimentGUI(tk.Toplevel):
         scrollbar_y = ttk.Scrollbar(table_container, orient="vertical")
         scrollbar_x = ttk.Scrollbar(table_container, orient="horizontal")
         
-        columns = ("Planner", "Mode", "Map Size", "Map ID", "Runtime (ms)", 
-                   "Expanded Nodes", "Path Length", "Path Cost", "Memory (KB)", "Found", "Status")
+        columns = self.RESULT_COLUMNS
         
         self.results_tree = ttk.Treeview(table_container, columns=columns, show="headings",
                                          yscrollcommand=scrollbar_y.set,
@@ -547,9 +687,8 @@ class ExperimentGUI(tk.Toplevel):
         if not self.results:
             return
         
-        # Clear existing items
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        # Clear existing items (one Tcl call for all of them)
+        self.results_tree.delete(*self.results_tree.get_children())
         
         # Get filter values
         planner_filter = self.filter_planner.get()
@@ -562,45 +701,62 @@ class ExperimentGUI(tk.Toplevel):
             planner_filter = "All"
             self.filter_planner.current(0)
         
-        # Filter and add rows
-        for result in self.results:
-            planner = result.get("planner", "")
-            size = result.get("map_size", "")
-            
-            if planner_filter != "All" and planner != planner_filter:
+        # Add the rows that pass the filters
+        for values in self._filtered_rows(planner_filter, size_filter):
+            self.results_tree.insert("", "end", values=values)
+    
+    def _request_table_update(self):
+        # Debounced _update_table: rapid filter changes redraw once, 150 ms
+        # after the last one
+        if self._table_pending is not None:
+            self.after_cancel(self._table_pending)
+        self._table_pending = self.after(150, self._run_table_update)
+
+    def _run_table_update(self):
+        self._table_pending = None
+        self._update_table()
+
+    @staticmethod
+    def _format_result_row(result):
+        """Format one result as a RESULT_COLUMNS row (done once per result)"""
+        mode = "Tree" if result.get("tree", False) else "Graph"
+        found = "Yes" if result.get("found", False) else "No"
+        
+        # Determine status: check if limit was reached
+        expanded = result.get("expanded_nodes", 0)
+        max_exp = result.get("max_expansions", 0)
+        found_bool = result.get("found", False)  # Use boolean for status logic
+        if max_exp > 0 and expanded >= max_exp and not found_bool:
+            status = "Limit Reached"
+        elif found_bool:
+            status = "Success"
+        else:
+            status = "Failed"
+        
+        return (
+            result.get("planner", ""),
+            mode,
+            result.get("map_size", ""),
+            str(result.get("map_id", "")),
+            f"{result.get('runtime_ms', 0):.2f}",
+            str(result.get("expanded_nodes", "N/A")),
+            str(result.get("path_len", "N/A")),
+            f"{result.get('path_cost', 0):.2f}" if result.get("path_cost") != float('inf') else "N/A",
+            f"{result['memory_kb']:.2f}" if result.get("memory_kb") is not None else "N/A",
+            found,
+            status
+        )
+    
+    def _filtered_rows(self, planner_filter, size_filter):
+        """Formatted rows of the results matching the planner/size filters"""
+        rows = []
+        for result, values in zip(self.results, self._result_rows):
+            if planner_filter != "All" and result.get("planner", "") != planner_filter:
                 continue
-            if size_filter != "All" and size != size_filter:
+            if size_filter != "All" and result.get("map_size", "") != size_filter:
                 continue
-            
-            mode = "Tree" if result.get("tree", False) else "Graph"
-            found = "Yes" if result.get("found", False) else "No"
-            
-            # Determine status: check if limit was reached
-            expanded = result.get("expanded_nodes", 0)
-            max_exp = result.get("max_expansions", 0)
-            found_bool = result.get("found", False)  # Use boolean for status logic
-            if max_exp > 0 and expanded >= max_exp and not found_bool:
-                status = "Limit Reached"
-            elif found_bool:
-                status = "Success"
-            else:
-                status = "Failed"
-            
-            values = (
-                planner,
-                mode,
-                size,
-                str(result.get("map_id", "")),
-                f"{result.get('runtime_ms', 0):.2f}",
-                str(result.get("expanded_nodes", "N/A")),
-                str(result.get("path_len", "N/A")),
-                f"{result.get('path_cost', 0):.2f}" if result.get("path_cost") != float('inf') else "N/A",
-                f"{result.get('memory_kb', 0):.2f}",
-                found,
-                status
-            )
-            
-            self.results_tree.insert("", "end", values=values)
+            rows.append(values)
+        return rows
     
     def _sort_table(self, column):
         """Sort table by column"""
@@ -630,11 +786,6 @@ class ExperimentGUI(tk.Toplevel):
     # --------------------------------------------------
     def _build_plots_panel(self, parent):
         """Build interactive plots panel"""
-        import matplotlib
-        matplotlib.use('TkAgg')
-        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-        from matplotlib.figure import Figure
-        
         # Control panel
         plot_controls = ttk.Frame(parent)
         plot_controls.pack(fill="x", padx=5, pady=5)
@@ -646,7 +797,7 @@ class ExperimentGUI(tk.Toplevel):
                                        state="readonly", width=15)
         self.plot_metric.current(0)
         self.plot_metric.pack(side="left", padx=5)
-        self.plot_metric.bind("<<ComboboxSelected>>", lambda e: self._update_plot())
+        self.plot_metric.bind("<<ComboboxSelected>>", lambda e: self._request_plot_update())
         
         ttk.Label(plot_controls, text="View:").pack(side="left", padx=5)
         self.plot_view = ttk.Combobox(plot_controls,
@@ -657,7 +808,7 @@ class ExperimentGUI(tk.Toplevel):
         self.plot_view.pack(side="left", padx=5)
         def on_view_change(e):
             self._toggle_map_filter()
-            self._update_plot()
+            self._request_plot_update()
         self.plot_view.bind("<<ComboboxSelected>>", on_view_change)
         
         # Map filter for heatmap view
@@ -666,7 +817,7 @@ class ExperimentGUI(tk.Toplevel):
                                              state="readonly", width=12)
         self.plot_map_filter.current(0)
         self.plot_map_filter.pack_forget()  # Hidden initially
-        self.plot_map_filter.bind("<<ComboboxSelected>>", lambda e: (self._reset_heatmap_navigation(), self._update_plot()))
+        self.plot_map_filter.bind("<<ComboboxSelected>>", lambda e: (self._reset_heatmap_navigation(), self._request_plot_update()))
         
         # Planner filter for heatmap view
         ttk.Label(plot_controls, text="Planner:").pack(side="left", padx=5)
@@ -674,7 +825,7 @@ class ExperimentGUI(tk.Toplevel):
                                                  state="readonly", width=12)
         self.plot_planner_filter.current(0)
         self.plot_planner_filter.pack_forget()  # Hidden initially
-        self.plot_planner_filter.bind("<<ComboboxSelected>>", lambda e: self._update_plot())
+        self.plot_planner_filter.bind("<<ComboboxSelected>>", lambda e: self._request_plot_update())
         
         # Navigation controls for heatmap view
         self.heatmap_nav_frame = ttk.Frame(plot_controls)
@@ -698,7 +849,7 @@ class ExperimentGUI(tk.Toplevel):
         
         # Matplotlib figure
         self.plot_fig = Figure(figsize=(10, 6), dpi=100)
-        self.plot_ax = self.plot_fig.add_subplot(111)
+        self.plot_ax = self._axes_grid("single", 1, 1)[0, 0]
         
         self.plot_canvas = FigureCanvasTkAgg(self.plot_fig, master=parent)
         self.plot_canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
@@ -710,16 +861,74 @@ class ExperimentGUI(tk.Toplevel):
         self.plot_ax.set_yticks([])
         self.plot_canvas.draw()
     
+    def _axes_grid(self, view, n_rows, n_cols):
+        """
+        Get an n_rows x n_cols grid of empty axes on the plot figure.
+        
+        Creating axes is a large part of a redraw, so if the figure still
+        holds the grid the same view created last time, its axes are
+        cleared and returned. Otherwise the figure is cleared and a new
+        grid is created. Views never share axes, so nothing a view sets
+        outside its axes (e.g. a suptitle) is left over for another one.
+        
+        Args:
+            view: Name of the view the axes are for
+            n_rows, n_cols: Shape of the grid
+            
+        Returns:
+            (n_rows, n_cols) array of Axes
+        """
+        key = (view, n_rows, n_cols)
+        if self._plot_axes is not None:
+            last_key, axes = self._plot_axes
+            if last_key == key and self.plot_fig.get_axes() == axes.ravel().tolist():
+                for ax in axes.flat:
+                    ax.clear()
+                return axes
+        
+        self.plot_fig.clear()
+        axes = self.plot_fig.subplots(n_rows, n_cols, squeeze=False)
+        self._plot_axes = (key, axes)
+        return axes
+    
+    def _show_plot_message(self, text):
+        """Show a centered message instead of a plot, reusing the main axes"""
+        self.plot_ax = self._axes_grid("single", 1, 1)[0, 0]
+        
+        self.plot_ax.text(0.5, 0.5, text, ha="center", va="center", fontsize=14)
+        self.plot_ax.set_xticks([])
+        self.plot_ax.set_yticks([])
+        self.plot_fig.tight_layout()
+        self.plot_canvas.draw()
+    
+    def _request_plot_update(self):
+        # Debounced _update_plot: a full matplotlib redraw takes long enough
+        # that quick combobox changes should only render the last one
+        if self._plot_pending is not None:
+            self.after_cancel(self._plot_pending)
+        self._plot_pending = self.after(150, self._run_plot_update)
+
+    def _run_plot_update(self):
+        self._plot_pending = None
+        self._update_plot()
+
+    def _results_frame(self):
+        """DataFrame of the results with a planner_label column (cached)"""
+        # Results are only appended during a run and cleared by
+        # generate_maps, so a length mismatch means the frame is stale.
+        # Plot and stats views filter the frame but must not modify it.
+        if self._results_df is None or len(self._results_df) != len(self.results):
+            df = pd.DataFrame(self.results)
+            df["planner_label"] = df["planner"] + "-" + df["tree"].map({True: "Tree", False: "Graph"})
+            self._results_df = df
+        return self._results_df
+
     def _update_plot(self):
         """Update comparison plot"""
         if not self.results:
             return
         
-        import pandas as pd
-        import matplotlib
-        matplotlib.use('TkAgg')
-        
-        df = pd.DataFrame(self.results)
+        df = self._results_frame()
         metric = self.plot_metric.get()
         view_type = self.plot_view.get()
         
@@ -741,17 +950,11 @@ class ExperimentGUI(tk.Toplevel):
         if metric not in df.columns:
             return
         
-        # Create planner label
-        df["planner_label"] = df["planner"] + "-" + df["tree"].map({True: "Tree", False: "Graph"})
-        
-        # Ensure axis exists (it may have been removed by other views that call plot_fig.clear())
-        if not self.plot_fig.get_axes() or self.plot_ax not in self.plot_fig.get_axes():
-            self.plot_ax = self.plot_fig.add_subplot(111)
-        
-        self.plot_ax.clear()
+        # Single axes, shared with _show_plot_message (other views replace
+        # the figure's axes, so they may have to be created again)
+        self.plot_ax = self._axes_grid("single", 1, 1)[0, 0]
         
         if view_type == "Box Plot":
-            import numpy as np
             # Group by planner_label
             data_by_planner = [df[df["planner_label"] == label][metric].values 
                               for label in df["planner_label"].unique()]
@@ -778,113 +981,79 @@ class ExperimentGUI(tk.Toplevel):
     
     def _plot_per_map_comparison(self, df, metric):
         """Display individual map comparisons grouped by map size"""
-        import numpy as np
-        
         if metric not in df.columns:
-            self.plot_fig.clear()
-            ax = self.plot_fig.add_subplot(111)
-            ax.text(0.5, 0.5, f"Metric '{metric}' not found", 
-                   ha="center", va="center", fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.plot_fig.tight_layout()
-            self.plot_canvas.draw()
+            self._show_plot_message(f"Metric '{metric}' not found")
             return
         
-        # Create planner label
-        df["planner_label"] = df["planner"] + "-" + df["tree"].map({True: "Tree", False: "Graph"})
-        
-        # Group by map_size and map_id
-        unique_maps = df[["map_size", "map_id"]].drop_duplicates().sort_values(["map_size", "map_id"])
+        # Metric value of every (map, planner) run, from one groupby pass
+        # instead of a boolean mask over the whole frame per map and planner
+        per_map = df.groupby(["map_size", "map_id", "planner_label"])[metric].first()
         
-        if unique_maps.empty:
-            self.plot_fig.clear()
-            ax = self.plot_fig.add_subplot(111)
-            ax.text(0.5, 0.5, "No maps found", 
-                   ha="center", va="center", fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.plot_fig.tight_layout()
-            self.plot_canvas.draw()
+        if per_map.empty:
+            self._show_plot_message("No maps found")
             return
         
         # Group by map size
-        map_sizes = sorted(df["map_size"].unique())
-        n_sizes = len(map_sizes)
-        
-        # Calculate grid: one row per map size, columns for maps within that size
-        max_maps_per_size = max(len(df[df["map_size"] == size]["map_id"].unique()) 
-                                for size in map_sizes) if map_sizes else 1
-        
-        # Clear figure and create subplots
-        self.plot_fig.clear()
-        
-        plot_idx = 0
-        for size_idx, map_size in enumerate(map_sizes):
-            size_maps = unique_maps[unique_maps["map_size"] == map_size]
+        map_size_of_map = per_map.index.droplevel("planner_label").unique().get_level_values("map_size")
+        maps_per_size = map_size_of_map.value_counts()
+        size_row = {map_size: row for row, map_size in enumerate(sorted(maps_per_size.index))}
+        
+        # Create all subplots at once: one row per map size, columns for
+        # maps within that size
+        axes = self._axes_grid("per_map", len(size_row), maps_per_size.max())
+        next_col = dict.fromkeys(size_row, 0)
+        
+        for (map_size, map_id), per_planner in per_map.groupby(level=["map_size", "map_id"]):
+            ax = axes[size_row[map_size], next_col[map_size]]
+            next_col[map_size] += 1
             
-            for map_idx, (_, row) in enumerate(size_maps.iterrows()):
-                map_id = row["map_id"]
-                
-                # Get results for this specific map
-                map_results = df[(df["map_size"] == map_size) & (df["map_id"] == map_id)]
-                
-                if map_results.empty:
-                    continue
-                
-                # Create subplot: rows = map sizes, cols = max maps per size
-                plot_idx += 1
-                ax = self.plot_fig.add_subplot(n_sizes, max_maps_per_size, plot_idx)
-                
-                # Get data for each planner
-                planners = sorted(map_results["planner_label"].unique())
-                values = []
-                labels = []
+            # Values per planner (sorted by label), without inf/NaN
+            per_planner = per_planner.droplevel(["map_size", "map_id"])
+            arr = per_planner.to_numpy(dtype=float)
+            finite = np.isfinite(arr)
+            values = arr[finite].tolist()
+            labels = per_planner.index[finite].tolist()
+            
+            if values:
+                # Create bar chart
+                bars = ax.bar(range(len(labels)), values)
+                ax.set_xticks(range(len(labels)))
+                ax.set_xticklabels(labels, rotation=45, ha="right", fontsize=8)
+                ax.set_ylabel(metric.replace("_", " ").title(), fontsize=8)
+                ax.set_title(f"{map_size} Map {map_id}", fontsize=9, fontweight='bold')
+                ax.grid(True, alpha=0.3, axis='y')
                 
-                for planner in planners:
-                    planner_data = map_results[map_results["planner_label"] == planner]
-                    if not planner_data.empty:
-                        metric_value = planner_data[metric].iloc[0]
-                        # Handle inf values
-                        if metric_value != float('inf') and not np.isnan(metric_value):
-                            values.append(metric_value)
-                            labels.append(planner)
+                # Use log scale for y-axis if metric is runtime_ms
+                if metric == "runtime_ms":
+                    # Filter out zero or negative values for log scale
+                    positive_values = [v for v in values if v > 0]
+                    if positive_values:
+                        ax.set_yscale('log')
+                        # Set minimum y value to avoid log(0) issues
+                        min_val = min(positive_values)
+                        ax.set_ylim(bottom=min_val * 0.5)  # Set bottom slightly below min
                 
-                if values:
-                    # Create bar chart
-                    bars = ax.bar(range(len(labels)), values)
-                    ax.set_xticks(range(len(labels)))
-                    ax.set_xticklabels(labels, rotation=45, ha="right", fontsize=8)
-                    ax.set_ylabel(metric.replace("_", " ").title(), fontsize=8)
-                    ax.set_title(f"{map_size} Map {map_id}", fontsize=9, fontweight='bold')
-                    ax.grid(True, alpha=0.3, axis='y')
-                    
-                    # Use log scale for y-axis if metric is runtime_ms
-                    if metric == "runtime_ms":
-                        # Filter out zero or negative values for log scale
-                        positive_values = [v for v in values if v > 0]
-                        if positive_values:
-                            ax.set_yscale('log')
-                            # Set minimum y value to avoid log(0) issues
-                            min_val = min(positive_values)
-                            ax.set_ylim(bottom=min_val * 0.5)  # Set bottom slightly below min
-                    
-                    # Add value labels on bars
-                    for i, (bar, val) in enumerate(zip(bars, values)):
-                        height = bar.get_height()
-                        # For log scale, position label relative to bar height
-                        if metric == "runtime_ms" and val > 0:
-                            label_y = height * 1.1  # Position above bar
-                        else:
-                            label_y = height
-                        ax.text(bar.get_x() + bar.get_width()/2., label_y,
-                               f'{val:.1f}' if val < 1000 else f'{val:.0f}',
-                               ha='center', va='bottom', fontsize=7)
-                else:
-                    ax.text(0.5, 0.5, "No data", 
-                           ha="center", va="center", fontsize=8)
-                    ax.set_xticks([])
-                    ax.set_yticks([])
+                # Add value labels on bars
+                for i, (bar, val) in enumerate(zip(bars, values)):
+                    height = bar.get_height()
+                    # For log scale, position label relative to bar height
+                    if metric == "runtime_ms" and val > 0:
+                        label_y = height * 1.1  # Position above bar
+                    else:
+                        label_y = height
+                    ax.text(bar.get_x() + bar.get_width()/2., label_y,
+                           f'{val:.1f}' if val < 1000 else f'{val:.0f}',
+                           ha='center', va='bottom', fontsize=7)
+            else:
+                ax.text(0.5, 0.5, "No data", 
+                       ha="center", va="center", fontsize=8)
+                ax.set_xticks([])
+                ax.set_yticks([])
+        
+        # Sizes with fewer maps leave empty cells at the end of their row
+        for map_size, row in size_row.items():
+            for ax in axes[row, next_col[map_size]:]:
+                ax.remove()
         
         # Set overall title
         self.plot_fig.suptitle(f"{metric.replace('_', ' ').title()} - Individual Map Comparison", 
@@ -895,60 +1064,38 @@ class ExperimentGUI(tk.Toplevel):
     
     def _plot_per_size_comparison(self, df, metric):
         """Display box plots grouped by map size"""
-        import numpy as np
-        import matplotlib.pyplot as plt
-        
         if metric not in df.columns:
-            self.plot_fig.clear()
-            ax = self.plot_fig.add_subplot(111)
-            ax.text(0.5, 0.5, f"Metric '{metric}' not found", 
-                   ha="center", va="center", fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.plot_fig.tight_layout()
-            self.plot_canvas.draw()
+            self._show_plot_message(f"Metric '{metric}' not found")
             return
         
-        # Create planner label
-        df["planner_label"] = df["planner"] + "-" + df["tree"].map({True: "Tree", False: "Graph"})
-        
         # Get unique map sizes
         map_sizes = sorted(df["map_size"].unique())
         
         if not map_sizes:
-            self.plot_fig.clear()
-            ax = self.plot_fig.add_subplot(111)
-            ax.text(0.5, 0.5, "No map sizes found", 
-                   ha="center", va="center", fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.plot_fig.tight_layout()
-            self.plot_canvas.draw()
+            self._show_plot_message("No map sizes found")
             return
         
-        # Clear figure and create subplots (one per map size)
+        # One subplot per map size
         n_sizes = len(map_sizes)
-        self.plot_fig.clear()
         
-        # Create subplots in a row
-        axes = []
-        for idx, map_size in enumerate(map_sizes):
-            ax = self.plot_fig.add_subplot(1, n_sizes, idx + 1)
-            axes.append(ax)
-            
-            # Get data for this map size
-            size_data = df[df["map_size"] == map_size]
-            
-            # Group by planner_label
-            planners = sorted(size_data["planner_label"].unique())
+        # Metric values per (map size, planner) and runs per map size, from
+        # one groupby pass instead of a boolean mask per size and planner
+        by_size = {}
+        for (map_size, planner), planner_data in df.groupby(["map_size", "planner_label"])[metric]:
+            by_size.setdefault(map_size, []).append((planner, planner_data))
+        runs_per_size = df["map_size"].value_counts()
+        
+        # Create subplots in a row, all at once
+        axes = self._axes_grid("per_size", 1, n_sizes)[0]
+        for ax, map_size in zip(axes, map_sizes):
+            # Group by planner_label (sorted by label)
             data_by_planner = []
             labels = []
             
-            for planner in planners:
-                planner_data = size_data[size_data["planner_label"] == planner][metric]
-                # Filter out inf and NaN values
-                valid_data = planner_data[(planner_data != float('inf')) & 
-                                         (~np.isnan(planner_data))].values
+            for planner, planner_data in by_size[map_size]:
+                # Filter out inf and NaN values (one isfinite pass)
+                vals = planner_data.to_numpy(dtype=float)
+                valid_data = vals[np.isfinite(vals)]
                 if len(valid_data) > 0:
                     data_by_planner.append(valid_data)
                     labels.append(planner)
@@ -957,10 +1104,9 @@ class ExperimentGUI(tk.Toplevel):
                 # Create box plot
                 bp = ax.boxplot(data_by_planner, labels=labels, patch_artist=True)
                 
-                # Color the boxes
-                colors = plt.cm.Set3(np.linspace(0, 1, len(bp['boxes'])))
-                for patch, color in zip(bp['boxes'], colors):
-                    patch.set_facecolor(color)
+                # Color the boxes (same color per planner in every panel)
+                for patch, label in zip(bp['boxes'], labels):
+                    patch.set_facecolor(self._PLANNER_COLORS[label])
                 
                 # Use log scale for y-axis if:
                 # - metric is runtime_ms for all map sizes (small, medium, large)
@@ -980,7 +1126,7 @@ class ExperimentGUI(tk.Toplevel):
                         ax.set_ylim(bottom=min_val * 0.5)  # Set bottom slightly below min
                 
                 ax.set_ylabel(metric.replace("_", " ").title(), fontsize=9)
-                ax.set_title(f"{map_size.title()} Maps\n(n={len(size_data)} runs)", 
+                ax.set_title(f"{map_size.title()} Maps\n(n={runs_per_size[map_size]} runs)", 
                             fontsize=10, fontweight='bold')
                 ax.tick_params(axis='x', rotation=45, labelsize=8)
                 ax.grid(True, alpha=0.3, axis='y')
@@ -1038,57 +1184,23 @@ class ExperimentGUI(tk.Toplevel):
     
     def _plot_heatmaps(self, df):
         """Display heatmaps in a grid layout"""
-        from matplotlib.colors import ListedColormap, BoundaryNorm
-        import matplotlib.pyplot as plt
-        import numpy as np
-        
-        # Improved colormap: white for unvisited, then clear gradient from visible color
-        # Free cells stay white, but exploration is immediately visible
-        colors = [
-            "black",        # -1 => obstacle (keep black for obstacles)
-            "#ffffff",      # 0  => unvisited (white - matches free cells)
-            "#b3d9ff",      # 1-5 => light blue (clearly visible, not white)
-            "#66b3ff",      # 5-10 => medium blue (light exploration)
-            "#1a8cff",      # 10-20 => blue (moderate exploration)
-            "#00cc66",      # 20-50 => green (increasing exploration)
-            "#ffcc00",      # 50-200 => yellow/orange (high exploration)
-            "#ff6600",      # 200+ => bright orange-red (maximum exploration)
-        ]
-        bounds = [-1, 0, 1, 5, 10, 20, 50, 200, 1_000_000]
-        cmap = ListedColormap(colors)
-        norm = BoundaryNorm(bounds, len(colors))
+        cmap = self._HEATMAP_CMAP
+        norm = self._HEATMAP_NORM
         
         # Filter results by map size if filter is set
         map_filter = self.plot_map_filter.get()
         if map_filter != "All":
             df = df[df["map_size"] == map_filter]
         
-        # Create planner label
-        df["planner_label"] = df["planner"] + "-" + df["tree"].map({True: "Tree", False: "Graph"})
-        
         if df.empty:
-            self.plot_fig.clear()
-            ax = self.plot_fig.add_subplot(111)
-            ax.text(0.5, 0.5, "No heatmaps available", 
-                   ha="center", va="center", fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.plot_fig.tight_layout()
-            self.plot_canvas.draw()
+            self._show_plot_message("No heatmaps available")
             return
         
-        # Group by map_size and map_id
-        unique_maps = df[["map_size", "map_id"]].drop_duplicates().sort_values(["map_size", "map_id"])
+        # Sorted unique (map_size, map_id) keys, from one groupby pass
+        unique_maps = df.groupby(["map_size", "map_id"]).size().index
         
         if unique_maps.empty:
-            self.plot_fig.clear()
-            ax = self.plot_fig.add_subplot(111)
-            ax.text(0.5, 0.5, "No maps found", 
-                   ha="center", va="center", fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.plot_fig.tight_layout()
-            self.plot_canvas.draw()
+            self._show_plot_message("No maps found")
             return
         
         # Get current map size (from filter or from current map being viewed)
@@ -1100,28 +1212,15 @@ class ExperimentGUI(tk.Toplevel):
                 current_map_size, _ = self.heatmap_map_list[self.current_heatmap_map_idx]
             else:
                 # Default to first map's size
-                current_map_size = unique_maps.iloc[0]["map_size"] if not unique_maps.empty else None
+                current_map_size = unique_maps[0][0]
         
-        # Filter to maps of current size only (navigate within size)
-        if current_map_size:
-            size_maps = unique_maps[unique_maps["map_size"] == current_map_size].sort_values("map_id")
-        else:
-            size_maps = unique_maps
-        
-        if size_maps.empty:
-            self.plot_fig.clear()
-            ax = self.plot_fig.add_subplot(111)
-            ax.text(0.5, 0.5, f"No {current_map_size} maps found", 
-                   ha="center", va="center", fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.plot_fig.tight_layout()
-            self.plot_canvas.draw()
-            return
+        # Map list for navigation: maps of the current size only (navigate
+        # within size), already sorted by map_id
+        new_map_list = [key for key in unique_maps if key[0] == current_map_size]
         
-        # Store map list for navigation (only maps of current size)
-        new_map_list = [(row["map_size"], row["map_id"]) 
-                       for _, row in size_maps.iterrows()]
+        if not new_map_list:
+            self._show_plot_message(f"No {current_map_size} maps found")
+            return
         
         # Check if lists are different by comparing their content
         lists_different = (
@@ -1177,36 +1276,43 @@ class ExperimentGUI(tk.Toplevel):
         
         # Get grid for this map
         if map_key not in self.grids:
-            self.plot_fig.clear()
-            ax = self.plot_fig.add_subplot(111)
-            ax.text(0.5, 0.5, f"Grid not found for {map_key}", 
-                   ha="center", va="center", fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.plot_fig.tight_layout()
-            self.plot_canvas.draw()
+            self._show_plot_message(f"Grid not found for {map_key}")
             return
         
         grid = self.grids[map_key]
         
+        # Scratch buffer the heatmaps of this map size are loaded into
+        heat_buf = self._heat_scratch.get(grid.shape)
+        if heat_buf is None:
+            heat_buf = self._heat_scratch[grid.shape] = np.empty(grid.shape, dtype=np.int16)
+        
         # Get all planners for this map
         map_results = df[(df["map_size"] == map_size) & (df["map_id"] == map_id)]
         unique_planners = sorted(map_results["planner_label"].unique())
         
         if not unique_planners:
-            self.plot_fig.clear()
-            ax = self.plot_fig.add_subplot(111)
-            ax.text(0.5, 0.5, f"No planners found for {map_key}", 
-                   ha="center", va="center", fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.plot_fig.tight_layout()
-            self.plot_canvas.draw()
+            self._show_plot_message(f"No planners found for {map_key}")
+            return
+        
+        # Update filter options
+        map_sizes = sorted(set(df["map_size"].unique()) if not df.empty else [])
+        self.plot_map_filter['values'] = ["All"] + list(map_sizes)
+        
+        # Same panels as already on screen (e.g. "Next" within one map
+        # size): only swap the data of the existing artists
+        panel_key = (grid.shape, tuple(unique_planners))
+        if self._update_heatmap_panels(panel_key, map_results, grid, heat_buf, map_key):
+            title = self.plot_fig.suptitle(f"Heatmap Comparison: {map_key}",
+                                          fontsize=12, fontweight='bold')
+            self._blit_heatmap_panels(title)
             return
         
         # Clear and create subplots: one row, one column per planner
         n_planners = len(unique_planners)
         self.plot_fig.clear()
+        self._heatmap_artists = None
+        panel_artists = []
+        row = self._map_row.get(map_key)
         
         for planner_idx, planner_label in enumerate(unique_planners):
             ax = self.plot_fig.add_subplot(1, n_planners, planner_idx + 1)
@@ -1225,57 +1331,53 @@ class ExperimentGUI(tk.Toplevel):
             heatmap_id = result.get("heatmap_id")
             
             if heatmap_id and heatmap_id in self.heatmaps:
-                heat = self.heatmaps[heatmap_id].copy()
+                heat = load_heatmap(self.heatmaps[heatmap_id], out=heat_buf)
                 h, w = heat.shape
                 
-                # Overlay obstacles
-                vis_grid = np.array(heat, dtype=float)
-                for y in range(h):
-                    for x in range(w):
-                        if grid[y, x] != 0:
-                            vis_grid[y, x] = -1
+                # Overlay obstacles in place: counts were saved clipped to
+                # uint8, so the int16 buffer holds them and the -1 marker
+                # (imshow copies the data, the buffer can be reused)
+                vis_grid = heat
+                vis_grid[grid != 0] = -1
                 
                 # Plot heatmap
-                im = ax.imshow(vis_grid, origin="lower", cmap=cmap, norm=norm, aspect='auto')
+                im = ax.imshow(vis_grid, origin="lower", cmap=cmap, norm=norm, aspect='auto',
+                               interpolation_stage='rgba')
                 
-                # Add path if available
-                path_id = heatmap_id
-                if path_id in self.paths:
-                    path = self.paths[path_id]
-                    px = [p[0] for p in path]
-                    py = [p[1] for p in path]
-                    # Bright orange path color
-                    ax.plot(px, py, color="#ff6600", linewidth=2.5, marker='o', markersize=3.5, label='Path')
+                # Add path (empty line if none, so it can be updated later)
+                path = load_grid_path(self.heatmaps[heatmap_id])
+                px, py = (path[:, 0], path[:, 1]) if path is not None else ([], [])
+                # Bright orange path color
+                path_line, = ax.plot(px, py, color="#ff6600", linewidth=2.5, marker='o', markersize=3.5, label='Path')
                 
                 # Add start/goal markers if available (show on all planners)
-                if map_key in self.starts:
-                    sx, sy = self.starts[map_key]
+                if row is not None:
+                    sx, sy = self.starts[row]
                     # Keep green for start (intuitive - "go")
-                    ax.plot(sx, sy, 'go', markersize=10, markeredgecolor='darkgreen', markeredgewidth=1.5, label='Start')
-                if map_key in self.goals:
-                    gx, gy = self.goals[map_key]
+                    start_mark, = ax.plot(sx, sy, 'go', markersize=10, markeredgecolor='darkgreen', markeredgewidth=1.5, label='Start')
+                    gx, gy = self.goals[row]
                     # Keep red for goal
-                    ax.plot(gx, gy, 'ro', markersize=10, markeredgecolor='darkred', markeredgewidth=1.5, label='Goal')
+                    goal_mark, = ax.plot(gx, gy, 'ro', markersize=10, markeredgecolor='darkred', markeredgewidth=1.5, label='Goal')
+                    panel_artists.append((im, path_line, start_mark, goal_mark))
                 
                 # Title with planner info
                 ax.set_title(planner_label, fontsize=10, fontweight='bold')
                 ax.set_xticks([])
                 ax.set_yticks([])
                 
-                # Grid lines
-                ax.set_xticks(np.arange(-0.5, w, 1), minor=True)
-                ax.set_yticks(np.arange(-0.5, h, 1), minor=True)
-                ax.grid(which="minor", color="gray", linestyle="-", linewidth=0.2)
+                # Grid lines: one line collection per direction instead of
+                # a minor tick (a full Tick artist) per cell border. Left
+                # out on larger maps, where cells are only a few pixels
+                # wide and the lines would mostly gray out the heatmap
+                if max(h, w) <= 40:
+                    ax.vlines(np.arange(-0.5, w, 1), -0.5, h - 0.5, colors="gray", linewidth=0.2, zorder=1.5)
+                    ax.hlines(np.arange(-0.5, h, 1), -0.5, w - 0.5, colors="gray", linewidth=0.2, zorder=1.5)
             else:
                 ax.text(0.5, 0.5, f"No heatmap\n{planner_label}", 
                        ha="center", va="center", fontsize=10)
                 ax.set_xticks([])
                 ax.set_yticks([])
         
-        # Update filter options
-        map_sizes = sorted(set(df["map_size"].unique()) if not df.empty else [])
-        self.plot_map_filter['values'] = ["All"] + list(map_sizes)
-        
         # Set overall title
         self.plot_fig.suptitle(f"Heatmap Comparison: {map_key}", 
                               fontsize=12, fontweight='bold')
@@ -1286,30 +1388,124 @@ class ExperimentGUI(tk.Toplevel):
         # Add colorbar (shared for all subplots) - positioned after tight_layout
         axes = self.plot_fig.get_axes()
         if axes:
-            sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-            sm.set_array([])
             # Position colorbar on the right side with proper spacing
-            cbar = self.plot_fig.colorbar(sm, ax=axes, 
+            cbar = self.plot_fig.colorbar(self._HEATMAP_MAPPABLE, ax=axes, 
                                          fraction=0.046, pad=0.08)
             cbar.set_label('Expansion Count', rotation=270, labelpad=15)
         
+        # Reusable only if every panel got a heatmap and markers
+        if len(panel_artists) == n_planners:
+            self._heatmap_artists = {
+                "key": panel_key,
+                "axes": self.plot_fig.get_axes(),
+                "panels": panel_artists,
+            }
+        
         self.plot_canvas.draw()
     
-    def _save_current_plot(self):
-        """Save the current plot with a descriptive filename"""
+    def _update_heatmap_panels(self, panel_key, map_results, grid, heat_buf, map_key):
+        """
+        Show another map in the heatmap panels already on the figure.
+        
+        Works when the figure still holds the panels of an earlier
+        _plot_heatmaps call for the same grid shape and planners; the
+        images, paths and markers are then updated with set_data, which
+        skips rebuilding axes, grid lines, colorbar and layout.
+        
+        Returns:
+            True if the panels were updated, False if they must be rebuilt
+        """
+        artists = self._heatmap_artists
+        if (artists is None or artists["key"] != panel_key
+                or artists["axes"] != self.plot_fig.get_axes()):
+            return False
+        
+        row = self._map_row.get(map_key)
+        files = []
+        for planner_label in panel_key[1]:
+            result = map_results[map_results["planner_label"] == planner_label].iloc[0]
+            heatmap_id = result.get("heatmap_id")
+            if row is None or not heatmap_id or heatmap_id not in self.heatmaps:
+                return False
+            files.append(self.heatmaps[heatmap_id])
+        
+        sx, sy = self.starts[row]
+        gx, gy = self.goals[row]
+        blocked = grid != 0
+        for (im, path_line, start_mark, goal_mark), heatmap_file in zip(artists["panels"], files):
+            vis_grid = load_heatmap(heatmap_file, out=heat_buf)
+            vis_grid[blocked] = -1
+            im.set_data(vis_grid)
+            
+            path = load_grid_path(heatmap_file)
+            if path is not None:
+                path_line.set_data(path[:, 0], path[:, 1])
+            else:
+                path_line.set_data([], [])
+            start_mark.set_data([sx], [sy])
+            goal_mark.set_data([gx], [gy])
+        return True
+    
+    def _blit_heatmap_panels(self, title):
+        """
+        Redraw only the parts of the heatmap figure that change per map.
+        
+        Everything else (axes frames, planner titles, colorbar) is kept as
+        a background image, captured once with the changing artists hidden
+        and again whenever the canvas size changes. The panels are then
+        drawn over it and copied to the screen (blitting), instead of a
+        full canvas.draw() per "Next" click.
+        
+        Args:
+            title: The figure's suptitle, already set to the new map
+        """
+        artists = self._heatmap_artists
+        canvas = self.plot_canvas
+        changing = [title]
+        for panel in artists["panels"]:
+            changing.extend(panel)
+            changing.extend(panel[0].axes.spines.values())
+        
+        size = canvas.get_width_height()
+        if artists.get("background_size") != size:
+            for artist in changing:
+                artist.set_visible(False)
+            canvas.draw()
+            for artist in changing:
+                artist.set_visible(True)
+            artists["background"] = canvas.copy_from_bbox(self.plot_fig.bbox)
+            artists["background_size"] = size
+        
+        canvas.restore_region(artists["background"])
+        for panel in artists["panels"]:
+            # The image covers the whole axes, so the grid lines and the
+            # frame on top of it are drawn again, in the usual order
+            ax = panel[0].axes
+            for artist in sorted([*ax.images, *ax.collections, *ax.lines, *ax.spines.values()],
+                                 key=lambda a: a.get_zorder()):
+                ax.draw_artist(artist)
+        self.plot_fig.draw_artist(title)
+        canvas.blit(self.plot_fig.bbox)
+    
+    def _save_current_plot(self, dpi=150):
+        """
+        Save the current plot with a descriptive filename.
+        
+        Args:
+            dpi: Output resolution (default 150, used by the Save Plot button)
+        """
         if not self.results:
             messagebox.showwarning("No Data", "No results available to save.")
             return
         
         from tkinter import filedialog
-        import pandas as pd
         
         # Get current view and metric
         view_type = self.plot_view.get()
         metric = self.plot_metric.get()
         
         # Determine tree/graph from results
-        df = pd.DataFrame(self.results)
+        df = self._results_frame()
         if "tree" in df.columns:
             tree_values = df["tree"].unique()
             if len(tree_values) == 1:
@@ -1322,12 +1518,11 @@ class ExperimentGUI(tk.Toplevel):
             search_type = "unknown"
         
         # Generate descriptive filename
-        # Replace spaces and special characters for filename safety
+        # Replace spaces for filename safety (metric names are identifiers)
         view_safe = view_type.replace(" ", "_").lower()
-        metric_safe = metric.replace("_", "_")
         
         # Filename without timestamp
-        default_filename = f"{view_safe}_{metric_safe}_{search_type}.png"
+        default_filename = f"{view_safe}_{metric}_{search_type}.png"
         
         # Ask user for save location
         filepath = filedialog.asksaveasfilename(
@@ -1340,7 +1535,7 @@ class ExperimentGUI(tk.Toplevel):
         if filepath:
             try:
                 # Save the figure
-                self.plot_fig.savefig(filepath, dpi=150, bbox_inches='tight')
+                self.plot_fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
                 messagebox.showinfo("Success", f"Plot saved to:\n{filepath}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save plot:\n{str(e)}")
@@ -1362,10 +1557,7 @@ class ExperimentGUI(tk.Toplevel):
         if not self.results:
             return
         
-        import pandas as pd
-        
-        df = pd.DataFrame(self.results)
-        df["planner_label"] = df["planner"] + "-" + df["tree"].map({True: "Tree", False: "Graph"})
+        df = self._results_frame()
         
         metrics = ["runtime_ms", "expanded_nodes", "path_len", "path_cost", "memory_kb"]
         
@@ -1426,17 +1618,7 @@ class ExperimentGUI(tk.Toplevel):
         size_filter = self.filter_size.get()
         
         # Filter results (same logic as _update_table)
-        filtered_results = []
-        for result in self.results:
-            planner = result.get("planner", "")
-            size = result.get("map_size", "")
-            
-            if planner_filter != "All" and planner != planner_filter:
-                continue
-            if size_filter != "All" and size != size_filter:
-                continue
-            
-            filtered_results.append(result)
+        filtered_results = self._filtered_rows(planner_filter, size_filter)
         
         if not filtered_results:
             messagebox.showwarning("No Data", "No results match the current filters.")
@@ -1456,58 +1638,11 @@ class ExperimentGUI(tk.Toplevel):
         
         if filepath:
             try:
-                # Define CSV columns (matching table columns)
-                columns = [
-                    "Planner", "Mode", "Map Size", "Map ID", 
-                    "Runtime (ms)", "Expanded Nodes", "Path Length", 
-                    "Path Cost", "Memory (KB)", "Found", "Status"
-                ]
-                
-                # Write CSV file
+                # Write CSV file (same columns and formatting as the table)
                 with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
                     writer = csv.writer(csvfile)
-                    
-                    # Write header
-                    writer.writerow(columns)
-                    
-                    # Write data rows
-                    for result in filtered_results:
-                        mode = "Tree" if result.get("tree", False) else "Graph"
-                        found = "Yes" if result.get("found", False) else "No"
-                        
-                        # Determine status
-                        expanded = result.get("expanded_nodes", 0)
-                        max_exp = result.get("max_expansions", 0)
-                        found_bool = result.get("found", False)
-                        if max_exp > 0 and expanded >= max_exp and not found_bool:
-                            status = "Limit Reached"
-                        elif found_bool:
-                            status = "Success"
-                        else:
-                            status = "Failed"
-                        
-                        # Format values (matching table display)
-                        runtime = f"{result.get('runtime_ms', 0):.2f}"
-                        expanded_nodes = str(result.get("expanded_nodes", "N/A"))
-                        path_len = str(result.get("path_len", "N/A"))
-                        path_cost = f"{result.get('path_cost', 0):.2f}" if result.get("path_cost") != float('inf') else "N/A"
-                        memory = f"{result.get('memory_kb', 0):.2f}"
-                        
-                        row = [
-                            result.get("planner", ""),
-                            mode,
-                            result.get("map_size", ""),
-                            str(result.get("map_id", "")),
-                            runtime,
-                            expanded_nodes,
-                            path_len,
-                            path_cost,
-                            memory,
-                            found,
-                            status
-                        ]
-                        
-                        writer.writerow(row)
+                    writer.writerow(self.RESULT_COLUMNS)
+                    writer.writerows(filtered_results)
                 
                 messagebox.showinfo(
                     "Success", 
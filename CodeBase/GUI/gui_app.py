@@ -158,7 +158,7 @@ class SearchGUI(tk.Tk):
         ttk.Label(control_frame, text="Search Algorithm").pack(**pad)
         self.search_type = ttk.Combobox(
             control_frame,
-            values=["Astar", "BFS", "DFS"],
+            values=["Astar", "BFS", "DFS", "BiBFS"],
             state="readonly"
         )
         self.search_type.current(0)
@@ -263,6 +263,8 @@ class SearchGUI(tk.Tk):
             }
 
             # Clear old visualization
+            if self.vis is not None:
+                self.vis.close()
             for w in self.vis_frame.winfo_children():
                 w.destroy()
 
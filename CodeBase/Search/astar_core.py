@@ -0,0 +1,144 @@
+"""
+A* Core - Array-Based Graph A* Search Loop
+
+This module contains the expansion loop of graph-based A* as a standalone
+function. Instead of Node objects, a heapdict and per-neighbor method calls,
+it works on flat per-cell tables indexed by y * width + x. It is used by
+AStarPlanner_graphbased for headless runs (no visualizer, no debug output)
+and expands cells in exactly the same order as the object-based loop.
+"""
+
+import math
+
+from .planner import heuristic_table
+
+
+def astar_search(free_moves, moves, start, goal, width, height, res, motion_model):
+    """
+    Run graph-based A* from start to goal.
+
+    OPEN is an indexed binary heap kept in parallel lists (priorities and
+    cell indices) plus a per-cell heap position table. Its sift rules mirror
+    heapdict, including how a re-prioritized entry is removed and pushed
+    again, so ties in f are broken exactly like in the object-based planner.
+
+    Args:
+        free_moves: Per-cell free-neighbor bitmasks as nested lists [y][x]
+            (bit k set if moves[k] leads to a free cell)
+        moves: List of (dx, dy) moves matching the bits of free_moves
+        start: Tuple (x, y) start position
+        goal: Tuple (x, y) goal position
+        width, height: Grid size in cells
+        res: Grid resolution (scales move costs and the heuristic)
+        motion_model: "4n" (Manhattan heuristic) or "8n" (octile heuristic)
+
+    Returns:
+        Tuple (path, expanded) where path is a list of (x, y) tuples or None
+        if no path exists, and expanded lists the flat index of every
+        expanded cell in expansion order
+    """
+    n = width * height
+    g_score = [0.0] * n
+    came_from = [-1] * n
+    closed = bytearray(n)
+    h_table = heuristic_table(width, height, (goal[0], goal[1]), res, motion_model)
+
+    # OPEN: heap of f-values and cell indices, pos[cell] = heap slot or -1
+    heap_f = []
+    heap_i = []
+    pos = [-1] * n
+
+    def swap(a, b):
+        heap_f[a], heap_f[b] = heap_f[b], heap_f[a]
+        heap_i[a], heap_i[b] = heap_i[b], heap_i[a]
+        pos[heap_i[a]] = a
+        pos[heap_i[b]] = b
+
+    def sift_up(k):
+        while k:
+            parent = (k - 1) >> 1
+            if heap_f[parent] < heap_f[k]:
+                break
+            swap(k, parent)
+            k = parent
+
+    def sift_down(k):
+        size = len(heap_f)
+        while True:
+            left = (k << 1) + 1
+            right = left + 1
+            low = left if left < size and heap_f[left] < heap_f[k] else k
+            if right < size and heap_f[right] < heap_f[low]:
+                low = right
+            if low == k:
+                break
+            swap(k, low)
+            k = low
+
+    def pop_min():
+        cell = heap_i[0]
+        last_f = heap_f.pop()
+        last_i = heap_i.pop()
+        if heap_f:
+            heap_f[0] = last_f
+            heap_i[0] = last_i
+            pos[last_i] = 0
+            sift_down(0)
+        pos[cell] = -1
+        return cell
+
+    def push(cell, f):
+        k = pos[cell]
+        if k >= 0:
+            # Re-prioritize: move the old entry to the root and drop it
+            while k:
+                parent = (k - 1) >> 1
+                swap(k, parent)
+                k = parent
+            pop_min()
+        pos[cell] = len(heap_f)
+        heap_f.append(f)
+        heap_i.append(cell)
+        sift_up(pos[cell])
+
+    # Movement cost per move: diagonal moves cost sqrt(2) times more
+    step = [math.sqrt(2) * res if dx != 0 and dy != 0 else 1 * res for dx, dy in moves]
+
+    sx, sy = start
+    goal_i = goal[1] * width + goal[0]
+    push(sy * width + sx, h_table[sy * width + sx])
+    expanded = []
+
+    while heap_f:
+        i = pop_min()
+        expanded.append(i)
+
+        if i == goal_i:
+            # Follow parent links back to the start
+            path = []
+            while i != -1:
+                path.append((i % width, i // width))
+                i = came_from[i]
+            return list(reversed(path)), expanded
+
+        closed[i] = 1
+        g = g_score[i]
+        y, x = divmod(i, width)
+        free = free_moves[y][x]
+
+        for k, (dx, dy) in enumerate(moves):
+            if not free >> k & 1:
+                continue
+            j = i + dy * width + dx
+            if closed[j]:
+                continue
+
+            new_g = g + step[k]
+            new_f = new_g + h_table[j]
+            # New cell, or a better path to a cell already in OPEN
+            if pos[j] < 0 or new_f < heap_f[pos[j]]:
+                g_score[j] = new_g
+                came_from[j] = i
+                push(j, new_f)
+
+    return None, expanded
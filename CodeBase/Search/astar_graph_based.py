@@ -9,6 +9,8 @@ blind search algorithms.
 """
 
 from .planner import Planner
+from .astar_core import astar_search
+import numpy as np
 from heapdict import heapdict
 import math
 
@@ -52,37 +54,9 @@ class AStarPlanner_graphbased(Planner):
         self.res = grid_map.resolution
         # Statistics for comparison and analysis
         self.expanded_count = 0    # Total number of nodes expanded
-        self.expansion_map = {}     # Maps each cell to how many times it was expanded
+        self.expansion_grid = np.zeros((grid_map.height, grid_map.width), dtype=np.int32)  # Per-cell expansion counts, indexed [y, x]
         self.debug = debug
 
-    def heuristic(self, a, b):
-        """
-        Calculate the heuristic (estimated cost) from point a to point b.
-        
-        The heuristic must be admissible (never overestimate) for A* to find
-        optimal paths. For 4-neighbor movement, we use Manhattan distance.
-        For 8-neighbor movement, we use octile distance which accounts for
-        diagonal movement.
-        
-        Args:
-            a: Start position (x, y)
-            b: Goal position (x, y)
-            
-        Returns:
-            Estimated cost from a to b (scaled by grid resolution)
-        """
-        x1, y1 = a
-        x2, y2 = b
-        dx, dy = abs(x1-x2), abs(y1-y2)
-
-        if self.motion_model == "4n":
-            # Manhattan distance: sum of horizontal and vertical distances
-            return (dx + dy) * self.res
-        else:  
-            # Octile distance: accounts for diagonal movement in 8-neighbor grids
-            # This is more accurate than Euclidean for grid-based pathfinding
-            return (max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy)) * self.res
-
     def get_neighbors(self, gx, gy):
         """
         Generate valid neighboring cells from the current position.
@@ -98,29 +72,13 @@ class AStarPlanner_graphbased(Planner):
         Yields:
             Tuple (nx, ny) for each valid neighbor
         """
-        # Define movement patterns based on motion model
-        if self.motion_model == "4n":
-            moves = [(1,0), (-1,0), (0,1), (0,-1)]
-        else:
-            # 8-neighbor: includes diagonal movements
-            moves = [
-                (1,0), (-1,0), (0,1), (0,-1),
-                (1,1), (1,-1), (-1,1), (-1,-1)
-            ]
-
-        for dx, dy in moves:
+        free = self._free_moves[gy][gx]
+        for k, (dx, dy) in enumerate(self._moves):
             nx, ny = gx + dx, gy + dy
-
-            # Skip if outside grid boundaries
-            if not self.grid_map.is_inside(nx, ny):
-                continue
-            # Skip if directly on an obstacle
-            if self.grid_map.is_obstacle(nx, ny):
-                continue
-            # Skip if blocked by inflated obstacle (robot too large to fit)
-            if self.grid_map.is_inflated(nx, ny):
+            # Skip if outside the grid, on an obstacle or blocked by inflation
+            if not free >> k & 1:
                 if self.visualizer:
-                    self.visualizer.draw_inflated(nx, ny)
+                    self._draw_if_inflated(nx, ny)
                 continue
 
             yield (nx, ny)
@@ -161,6 +119,10 @@ class AStarPlanner_graphbased(Planner):
         Returns:
             List of (x, y) tuples representing the path, or None if no path exists
         """
+        # Headless runs use the array-based loop (same expansion order)
+        if not self.visualizer and not self.debug:
+            return self.plan_headless(start, goal)
+
         # Priority queue of nodes to explore, ordered by f-cost (g + h)
         OPEN = heapdict()
         # Set of nodes that have been fully explored
@@ -168,8 +130,11 @@ class AStarPlanner_graphbased(Planner):
         # Dictionary mapping states to Node objects for path reconstruction
         NODES = {} 
 
+        # Per-cell heuristic table for this goal (shared, see heuristic_table)
+        self.reset_heuristic_cache(goal)
+
         # Initialize with start node
-        start_node = Node(start, g=0.0, f=self.heuristic(start, goal))
+        start_node = Node(start, g=0.0, f=self.cached_heuristic(*start))
         OPEN[start] = start_node.f        
         NODES[start] = start_node
 
@@ -186,7 +151,7 @@ class AStarPlanner_graphbased(Planner):
             # Track statistics for analysis
             self.expanded_count += 1
             x, y = current_state
-            self.expansion_map[(x, y)] = self.expansion_map.get((x, y), 0) + 1
+            self.expansion_grid[y, x] += 1
 
             # Debug output showing search progress
             if self.debug:
@@ -228,7 +193,7 @@ class AStarPlanner_graphbased(Planner):
 
                 # Calculate new cost and f-value for this path
                 new_g = current.g + self.cost(cx, cy, v[0], v[1])
-                new_f = new_g + self.heuristic(v, goal)
+                new_f = new_g + self.cached_heuristic(v[0], v[1])
             
                 if v not in OPEN:
                     # New node discovered - add it to OPEN set
@@ -258,12 +223,37 @@ class AStarPlanner_graphbased(Planner):
         # No path found if we exhaust all possibilities
         return None
 
+    def plan_headless(self, start, goal):
+        """
+        Run A* with the array-based search loop from astar_core.
+        
+        Produces the same path and expansion statistics as plan() but skips
+        the per-node objects and visualization hooks.
+        
+        Args:
+            start: Tuple (x, y) representing the start position
+            goal: Tuple (x, y) representing the goal position
+            
+        Returns:
+            List of (x, y) tuples representing the path, or None if no path exists
+        """
+        path, expanded = astar_search(
+            self._free_moves, self._moves, start, goal,
+            self.grid_map.width, self.grid_map.height,
+            self.res, self.motion_model
+        )
+
+        # Track statistics for analysis
+        self.expanded_count += len(expanded)
+        np.add.at(self.expansion_grid.reshape(-1), np.asarray(expanded, dtype=np.intp), 1)
+        return path
+
     def reconstruct_path(self, node):
         """
         Reconstruct the full path from goal back to start.
         
-        Follows parent pointers from the goal node all the way back to the start,
-        then reverses the list to get the path in forward order.
+        Same as build_partial_path, but used when the goal is reached
+        to get the complete solution path.
         
         Args:
             node: The goal node (or any node in the path)
@@ -271,11 +261,7 @@ class AStarPlanner_graphbased(Planner):
         Returns:
             List of (x, y) tuples representing the complete path
         """
-        path = []
-        while node is not None:
-            path.append(node.state)
-            node = node.parent
-        return list(reversed(path))
+        return self.build_partial_path(node)
 
     def build_partial_path(self, node):
         """
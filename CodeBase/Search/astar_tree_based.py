@@ -9,6 +9,7 @@ visit ID to track different paths through the same cell.
 """
 
 from .planner import Planner
+import numpy as np
 import heapq
 import math
 from collections import defaultdict
@@ -40,44 +41,20 @@ class AStarPlanner_treebased(Planner):
         self.counter = 0
         # Statistics for comparison and analysis
         self.expanded_count = 0
-        self.expansion_map = {}
+        self.expansion_grid = np.zeros((grid_map.height, grid_map.width), dtype=np.int32)
         self.debug = debug
 
-    # ----------------------------------------
-    # Heuristic
-    # ----------------------------------------
-    def heuristic(self, a, b):
-        x1, y1 = a
-        x2, y2 = b
-        dx, dy = abs(x1 - x2), abs(y1 - y2)
-
-        if self.motion_model == "4n":
-            return (dx + dy) * self.res
-        else:
-            return (max(dx, dy) + (math.sqrt(2)-1) * min(dx, dy)) * self.res
-
     # ----------------------------------------
     # Neighbors
     # ----------------------------------------
     def get_neighbors(self, gx, gy):
-        if self.motion_model == "4n":
-            moves = [(1,0),(-1,0),(0,1),(0,-1)]
-        else:
-            moves = [
-                (1,0),(-1,0),(0,1),(0,-1),
-                (1,1),(1,-1),(-1,1),(-1,-1)
-            ]
-
-        for dx, dy in moves:
+        free = self._free_moves[gy][gx]
+        for k, (dx, dy) in enumerate(self._moves):
             nx, ny = gx + dx, gy + dy
-
-            if not self.grid_map.is_inside(nx, ny):
-                continue
-            if self.grid_map.is_obstacle(nx, ny):
-                continue
-            if self.grid_map.is_inflated(nx, ny):
+            # Skip if outside the grid, on an obstacle or blocked by inflation
+            if not free >> k & 1:
                 if self.visualizer:
-                    self.visualizer.draw_inflated(nx, ny)
+                    self._draw_if_inflated(nx, ny)
                 continue
 
             yield (nx, ny)
@@ -115,8 +92,11 @@ class AStarPlanner_treebased(Planner):
         parent = defaultdict(dict)
         g_cost = defaultdict(dict)
 
+        # Per-cell heuristic table for this goal (shared, see heuristic_table)
+        self.reset_heuristic_cache(goal)
+
         # Initialize with start node (visit_id = 0)
-        h0 = self.heuristic(start, goal)
+        h0 = self.cached_heuristic(*start)
         g_cost[start][0] = 0.0
         heapq.heappush(OPEN, (h0, 0.0, 0, start))
         self.counter = 1  # Next visit ID will be 1
@@ -133,7 +113,7 @@ class AStarPlanner_treebased(Planner):
 
             # Track expansion statistics
             self.expanded_count += 1
-            self.expansion_map[(cx, cy)] = self.expansion_map.get((cx, cy), 0) + 1
+            self.expansion_grid[cy, cx] += 1
 
             # Debug print
             if self.debug:
@@ -162,7 +142,7 @@ class AStarPlanner_treebased(Planner):
                 nx, ny = child
                 # Calculate costs for this new path
                 ng = g + self.cost(cx, cy, nx, ny)
-                nf = ng + self.heuristic(child, goal)
+                nf = ng + self.cached_heuristic(nx, ny)
 
                 # Assign unique visit ID to this visit of the child cell
                 child_vid = self.counter
@@ -179,102 +159,3 @@ class AStarPlanner_treebased(Planner):
                     vis.draw_frontier(nx, ny)
 
         return None
-
-    # ----------------------------------------
-    # SAFE 3D reconstruction
-    # ----------------------------------------
-    def reconstruct_path_3d(self, parent, start, goal, vid):
-        """
-        Reconstruct the full path from goal back to start using 3D parent pointers.
-        
-        Since tree-based search uses visit IDs, we need to follow both the state
-        and visit ID through the parent chain. Includes loop detection for safety.
-        
-        Args:
-            parent: 3D parent dictionary
-            start: Start position
-            goal: Goal position
-            vid: Visit ID of the goal node
-            
-        Returns:
-            List of (x, y) tuples representing the complete path
-        """
-        path = []
-        cur_state = goal
-        cur_vid = vid
-
-        visited = set()
-
-        while True:
-            path.append(cur_state)
-
-            if cur_state == start:
-                break
-
-            # detect loops
-            if (cur_state, cur_vid) in visited:
-                print("[ERROR] Loop detected in 3D final path!")
-                break
-
-            visited.add((cur_state, cur_vid))
-
-            # validate parent entry
-            if cur_state not in parent or cur_vid not in parent[cur_state]:
-                print("[ERROR] Missing parent link in 3D final path. Returning partial path.")
-                break
-
-            # follow parent
-            prev_state, prev_vid = parent[cur_state][cur_vid]
-
-            cur_state = prev_state
-            cur_vid = prev_vid
-
-        return list(reversed(path))
-    # ----------------------------------------
-    # Build partial path for visualization
-    # ----------------------------------------
-    def build_partial_path_3d(self, parent, start, state, vid):
-        """
-        Build a partial path from the given state back to start for visualization.
-        
-        Used during search to show the current best path to any node being explored.
-        Includes loop detection to prevent infinite loops in visualization.
-        
-        Args:
-            parent: 3D parent dictionary
-            start: Start position
-            state: Current state to build path from
-            vid: Visit ID of the current state
-            
-        Returns:
-            List of (x, y) tuples representing the partial path
-        """
-        path = []
-        cur_state = state
-        cur_vid = vid
-        
-        visited = set()
-
-        while True:
-            path.append(cur_state)
-
-            if cur_state == start:
-                break
-
-            # detect infinite loops
-            if (cur_state, cur_vid) in visited:
-                print("[WARN] Loop in partial 3D path — breaking early.")
-                break
-
-            visited.add((cur_state, cur_vid))
-
-            if cur_state not in parent or cur_vid not in parent[cur_state]:
-                print("[WARN] Missing parent in partial 3D path — breaking early.")
-                break
-
-            prev_state, prev_vid = parent[cur_state][cur_vid]
-
-            cur_state = prev_state
-            cur_vid = prev_vid
-
-        return list(reversed(path))
\ No newline at end of file
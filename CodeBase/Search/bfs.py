@@ -8,6 +8,8 @@ instead of a priority queue.
 """
 
 from .planner import Planner
+from .bfs_core import bfs_search
+import numpy as np
 from collections import deque, defaultdict
 
 class BFSPlanner_graphbased(Planner):
@@ -33,35 +35,19 @@ class BFSPlanner_graphbased(Planner):
         super().__init__(grid_map, motion_model, visualizer)
         # Statistics for comparison and analysis
         self.expanded_count = 0
-        self.expansion_map = {}
+        self.expansion_grid = np.zeros((grid_map.height, grid_map.width), dtype=np.int32)
         self.debug = debug
 
 
     def get_neighbors(self, gx, gy):
-        if self.motion_model == "4n":
-            moves = [
-                (1, 0), (-1, 0),
-                (0, 1), (0, -1),
-            ]
-        else:  # default: "8n"
-            moves = [
-                (1, 0), (-1, 0),
-                (0, 1), (0, -1),
-                (1, 1), (1, -1),
-                (-1, 1), (-1, -1),
-            ]
-
-        for dx, dy in moves:
+        free = self._free_moves[gy][gx]
+        for k, (dx, dy) in enumerate(self._moves):
             nx, ny = gx + dx, gy + dy
-            if not self.grid_map.is_inside(nx, ny):
-                continue
-            if self.grid_map.is_obstacle(nx, ny):
-                continue
-            if self.grid_map.is_inflated(nx, ny):
-                
+            # Skip if outside the grid, on an obstacle or blocked by inflation
+            if not free >> k & 1:
                 if self.visualizer:
-                    self.visualizer.draw_inflated(nx, ny)
-                continue         
+                    self._draw_if_inflated(nx, ny)
+                continue
 
             yield nx, ny
 
@@ -80,6 +66,10 @@ class BFSPlanner_graphbased(Planner):
         Returns:
             List of (x, y) tuples representing the path, or None if no path exists
         """
+        # Headless runs use the array-based loop (same expansion order)
+        if not self.visualizer and not self.debug:
+            return self.plan_headless(start, goal)
+
         sx, sy = start
         gx, gy = goal
 
@@ -92,33 +82,40 @@ class BFSPlanner_graphbased(Planner):
         if start == goal:
             return [start]
 
+        # Cells are keyed by packed index (y * width + x) instead of tuples
+        start_i = self.pack(sx, sy)
+        goal_i = self.pack(gx, gy)
+
         # Queue for nodes to explore (FIFO - first in, first out)
-        open_queue = deque([start])
-        in_open = set([start])  # Fast lookup to check if node is in queue
+        open_queue = deque([start_i])
+        in_open = {start_i}  # Fast lookup to check if node is in queue
 
         # Set of nodes that have been fully explored
         closed = set()
         # Dictionary to reconstruct path: parent[child] = parent_node
         parent = {}
 
+        # Flat view of the expansion counts, indexed by packed index
+        expansions = self.expansion_grid.reshape(-1)
+
         while open_queue:
 
             current = open_queue.popleft()
-            cx, cy = current      
 
             # Track expansion statistics
             self.expanded_count += 1
-            self.expansion_map[(cx, cy)] = self.expansion_map.get((cx, cy), 0) + 1
+            expansions[current] += 1
 
             closed.add(current)
 
             if vis:
+                cx, cy = self.unpack(current)
                 if self.grid_map.is_inflated(cx, cy):
                     vis.draw_inflated(cx, cy)
                 else:
                     vis.draw_explored(cx, cy)
 
-                partial = self.build_partial_path(parent, start, current)
+                partial = self.build_partial_path(parent, start_i, current)
                 for i in range(len(partial) - 1):
                     x1, y1 = partial[i]
                     x2, y2 = partial[i + 1]
@@ -127,43 +124,67 @@ class BFSPlanner_graphbased(Planner):
 
 
             # Explore all neighbors
-            for nx, ny in self.get_neighbors(cx, cy):
-                v = (nx, ny)
+            for v in self.get_neighbor_indices(current):
 
                 # Only process if not already explored and not in queue
                 if (v not in closed) and (v not in in_open):
                     # Check if we reached the goal
-                    if v == goal:
+                    if v == goal_i:
                         parent[v] = current
-                        return self.reconstruct_path(parent, start, v)
+                        return self.reconstruct_path(parent, start_i, v)
                     # Add to queue for exploration
                     open_queue.append(v)
                     in_open.add(v)
                     parent[v] = current
 
                     if vis:
+                        nx, ny = self.unpack(v)
                         if self.grid_map.is_inflated(nx, ny):
                             vis.draw_inflated(nx, ny)
                         else:
                             vis.draw_frontier(nx, ny)
         return None  
     
+    def plan_headless(self, start, goal):
+        """
+        Run BFS with the array-based search loop from bfs_core.
+        
+        Produces the same path and expansion statistics as plan() but skips
+        the set/dict bookkeeping and visualization hooks.
+        
+        Args:
+            start: Tuple (x, y) representing the start position
+            goal: Tuple (x, y) representing the goal position
+            
+        Returns:
+            List of (x, y) tuples representing the path, or None if no path exists
+        """
+        path, expanded = bfs_search(
+            self._free_moves, self._offsets, start, goal,
+            self.grid_map.width, self.grid_map.height
+        )
+
+        # Track statistics for analysis (graph BFS expands a cell only once)
+        self.expanded_count += len(expanded)
+        self.expansion_grid.reshape(-1)[np.asarray(expanded, dtype=np.intp)] += 1
+        return path
+
     def build_partial_path(self, parent, start, current):
         """
         Build a partial path from current node back to start for visualization.
         
         Args:
-            parent: Parent dictionary
-            start: Start position
-            current: Current position
+            parent: Parent dictionary keyed by packed index
+            start: Packed index of the start position
+            current: Packed index of the current position
             
         Returns:
             List of (x, y) tuples representing the partial path
         """
-        path = [current]
+        path = [self.unpack(current)]
         while current in parent:
             current = parent[current]
-            path.append(current)
+            path.append(self.unpack(current))
             if current == start:
                 break
         path.reverse()
@@ -177,18 +198,18 @@ class BFSPlanner_graphbased(Planner):
         the path in forward order.
         
         Args:
-            parent: Parent dictionary
-            start: Start position
-            goal: Goal position
+            parent: Parent dictionary keyed by packed index
+            start: Packed index of the start position
+            goal: Packed index of the goal position
             
         Returns:
             List of (x, y) tuples representing the complete path
         """
-        path = [goal]
+        path = [self.unpack(goal)]
         current = goal
         while current != start:
             current = parent[current]
-            path.append(current)
+            path.append(self.unpack(current))
         path.reverse()
         return path
     
@@ -218,28 +239,18 @@ class BFSPlanner_treesearch(Planner):
         self.counter = 0
         # Statistics for comparison and analysis
         self.expanded_count = 0
-        self.expansion_map = {}
+        self.expansion_grid = np.zeros((grid_map.height, grid_map.width), dtype=np.int32)
         self.max_expansions = max_expansions
         self.debug = debug
 
     def get_neighbors(self, gx, gy):
-        if self.motion_model == "4n":
-            moves = [(1,0), (-1,0), (0,1), (0,-1)]
-        else:  # default: "8n"
-            moves = [
-                (1,0), (-1,0), (0,1), (0,-1),
-                (1,1), (1,-1), (-1,1), (-1,-1)
-            ]
-
-        for dx, dy in moves:
+        free = self._free_moves[gy][gx]
+        for k, (dx, dy) in enumerate(self._moves):
             nx, ny = gx + dx, gy + dy
-            if not self.grid_map.is_inside(nx, ny):
-                continue
-            if self.grid_map.is_obstacle(nx, ny):
-                continue
-            if self.grid_map.is_inflated(nx, ny):
+            # Skip if outside the grid, on an obstacle or blocked by inflation
+            if not free >> k & 1:
                 if self.visualizer:
-                    self.visualizer.draw_inflated(nx, ny)
+                    self._draw_if_inflated(nx, ny)
                 continue
 
             yield nx, ny
@@ -285,7 +296,7 @@ class BFSPlanner_treesearch(Planner):
 
             # Track expansion statistics
             self.expanded_count += 1
-            self.expansion_map[(cx, cy)] = self.expansion_map.get((cx, cy), 0) + 1
+            self.expansion_grid[cy, cx] += 1
 
             # Debug print
             if self.debug:
@@ -318,96 +329,3 @@ class BFSPlanner_treesearch(Planner):
                     vis.draw_frontier(child[0], child[1])
 
         return None
-    
-    def reconstruct_path_3d(self, parent, start, goal, vid):
-        """
-        Reconstruct the full path from goal back to start using 3D parent pointers.
-        
-        Since tree-based search uses visit IDs, we need to follow both the state
-        and visit ID through the parent chain. Includes loop detection for safety.
-        
-        Args:
-            parent: 3D parent dictionary
-            start: Start position
-            goal: Goal position
-            vid: Visit ID of the goal node
-            
-        Returns:
-            List of (x, y) tuples representing the complete path
-        """
-        path = []
-        cur_state = goal
-        cur_vid = vid
-
-        visited = set()
-
-        while True:
-            path.append(cur_state)
-
-            if cur_state == start:
-                break
-
-            if (cur_state, cur_vid) in visited:
-                print("[ERROR] Loop detected in 3D final path!")
-                break
-
-            visited.add((cur_state, cur_vid))
-
-
-            if cur_state not in parent or cur_vid not in parent[cur_state]:
-                print("[ERROR] Missing parent link in 3D final path. Returning partial path.")
-                break
-
-            prev_state, prev_vid = parent[cur_state][cur_vid]
-
-            cur_state = prev_state
-            cur_vid = prev_vid
-
-        return list(reversed(path))
-    
-    def build_partial_path_3d(self, parent, start, state, vid):
-        """
-        Build a partial path from the given state back to start for visualization.
-        
-        Used during search to show the current best path to any node being explored.
-        Includes loop detection to prevent infinite loops in visualization.
-        
-        Args:
-            parent: 3D parent dictionary
-            start: Start position
-            state: Current state to build path from
-            vid: Visit ID of the current state
-            
-        Returns:
-            List of (x, y) tuples representing the partial path
-        """
-        path = []
-        cur_state = state
-        cur_vid = vid
-        
-        visited = set()
-
-        while True:
-            path.append(cur_state)
-
-            if cur_state == start:
-                break
-
-
-            if (cur_state, cur_vid) in visited:
-                print("[WARN] Loop in partial 3D path — breaking early.")
-                break
-
-            visited.add((cur_state, cur_vid))
-
-            if cur_state not in parent or cur_vid not in parent[cur_state]:
-                print("[WARN] Missing parent in partial 3D path — breaking early.")
-                break
-
-            prev_state, prev_vid = parent[cur_state][cur_vid]
-
-            cur_state = prev_state
-            cur_vid = prev_vid
-
-        return list(reversed(path))
-
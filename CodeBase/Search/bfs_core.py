@@ -0,0 +1,74 @@
+"""
+BFS Core - Array-Based Graph BFS Search Loop
+
+This module contains the expansion loop of graph-based BFS as a standalone
+function. Instead of sets, a parent dict and a neighbor generator, it works
+on flat per-cell tables indexed by y * width + x. It is used by
+BFSPlanner_graphbased for headless runs (no visualizer, no debug output)
+and expands cells in exactly the same order as the planner's own loop.
+"""
+
+
+def bfs_search(free_moves, offsets, start, goal, width, height):
+    """
+    Run graph-based BFS from start to goal.
+
+    The FIFO queue is a plain list read through a head index, and a single
+    seen table replaces the CLOSED set and the in-queue set: a cell is
+    queued at most once, so being seen is the same as being in either.
+
+    Args:
+        free_moves: Per-cell free-neighbor bitmasks as nested lists [y][x]
+            (bit k set if move k leads to a free cell)
+        offsets: Packed index offset of each move, matching the bits of
+            free_moves
+        start: Tuple (x, y) start position
+        goal: Tuple (x, y) goal position
+        width, height: Grid size in cells
+
+    Returns:
+        Tuple (path, expanded) where path is a list of (x, y) tuples or None
+        if no path exists, and expanded lists the flat index of every
+        expanded cell in expansion order
+    """
+    start_i = start[1] * width + start[0]
+    goal_i = goal[1] * width + goal[0]
+    if start_i == goal_i:
+        return [start], []
+
+    came_from = [-1] * (width * height)
+    seen = bytearray(width * height)
+    seen[start_i] = 1
+
+    queue = [start_i]
+    head = 0
+    moves = list(enumerate(offsets))
+
+    while head < len(queue):
+        i = queue[head]
+        head += 1
+
+        y, x = divmod(i, width)
+        free = free_moves[y][x]
+
+        for k, offset in moves:
+            if not free >> k & 1:
+                continue
+            j = i + offset
+            if seen[j]:
+                continue
+
+            came_from[j] = i
+            # Goal test when the cell is generated, as in the planner
+            if j == goal_i:
+                path = []
+                while j != -1:
+                    path.append((j % width, j // width))
+                    j = came_from[j]
+                path.reverse()
+                return path, queue[:head]
+
+            seen[j] = 1
+            queue.append(j)
+
+    return None, queue
@@ -0,0 +1,168 @@
+"""
+Bidirectional Breadth-First Search (BiBFS) Path Planner
+
+This module implements a graph-based BFS that searches forward from the start
+and backward from the goal at the same time, and stops where the two searches
+meet. Both searches grow one full level at a time, so the path has as few
+steps as the one found by plain BFS, while each side only has to cover about
+half the distance. Moves are symmetric on the grid, so the backward search
+uses the same neighbors as the forward one.
+"""
+
+from .planner import Planner
+import numpy as np
+
+
+class BidirectionalBFSPlanner(Planner):
+    """
+    Bidirectional Breadth-First Search planner (graph-based).
+
+    Each side keeps its own distance and parent tables, indexed by packed
+    cell index. The side with the smaller frontier expands its next level;
+    when a newly reached cell has already been reached by the other side,
+    the two half-paths are joined through it. All meeting cells of that
+    level are compared so the shortest joined path is returned.
+    """
+
+    def __init__(self, grid_map, motion_model, visualizer=None, debug=False):
+        """
+        Initialize the bidirectional BFS planner.
+
+        Args:
+            grid_map: GridMap object representing the search space
+            motion_model: "4n" for 4-neighbor or "8n" for 8-neighbor movement
+            visualizer: Optional visualizer for real-time search visualization
+            debug: If True, print debug information during search (default: False)
+        """
+        super().__init__(grid_map, motion_model, visualizer)
+        # Statistics for comparison and analysis; a cell expanded by both
+        # searches is counted twice
+        self.expanded_count = 0
+        self.expansion_grid = np.zeros((grid_map.height, grid_map.width), dtype=np.int32)
+        self.debug = debug
+
+    def plan(self, start, goal):
+        """
+        Execute bidirectional BFS to find a path from start to goal.
+
+        Args:
+            start: Tuple (x, y) representing the start position
+            goal: Tuple (x, y) representing the goal position
+
+        Returns:
+            List of (x, y) tuples representing the path, or None if no path exists
+        """
+        vis = self.visualizer
+        if vis:
+            vis.draw_start_goal(start, goal)
+            vis.update()
+
+        # Early exit if start equals goal
+        if start == goal:
+            return [start]
+
+        # The backward search starts at the goal, so it must be enterable
+        if not self.grid_map.is_inside(*goal) or self._occ.item(goal[1], goal[0]):
+            return None
+
+        start_i = self.pack(*start)
+        goal_i = self.pack(*goal)
+
+        # Per-side tables: steps from that side's root (-1 = not reached)
+        # and parent index towards the root
+        n = self.grid_map.width * self.grid_map.height
+        dist_f, parent_f = [-1] * n, [-1] * n
+        dist_b, parent_b = [-1] * n, [-1] * n
+        dist_f[start_i] = 0
+        dist_b[goal_i] = 0
+
+        frontier_f = [start_i]
+        frontier_b = [goal_i]
+
+        while frontier_f and frontier_b:
+            # Grow the cheaper side by one full level
+            if len(frontier_f) <= len(frontier_b):
+                frontier_f, meet = self._expand_level(frontier_f, dist_f, parent_f, dist_b)
+            else:
+                frontier_b, meet = self._expand_level(frontier_b, dist_b, parent_b, dist_f)
+
+            if meet >= 0:
+                if self.debug:
+                    print(f"[BiBFS] Searches met at {self.unpack(meet)}, "
+                          f"{dist_f[meet] + dist_b[meet]} steps")
+                return self.join_paths(parent_f, parent_b, meet)
+
+        return None
+
+    def _expand_level(self, frontier, dist, parent, other_dist):
+        """
+        Expand every cell of one side's frontier.
+
+        Args:
+            frontier: Packed indices of the cells to expand (one BFS level)
+            dist: Step counts of this side, updated for new cells
+            parent: Parent indices of this side, updated for new cells
+            other_dist: Step counts of the other side, to detect meetings
+
+        Returns:
+            Tuple (next_frontier, meet): the next level, and the meeting cell
+            with the shortest joined path or -1 if the sides did not meet
+        """
+        vis = self.visualizer
+        expansions = self.expansion_grid.reshape(-1)
+        next_frontier = []
+        meet = -1
+        best = -1
+
+        for current in frontier:
+            # Track expansion statistics
+            self.expanded_count += 1
+            expansions[current] += 1
+
+            if vis:
+                cx, cy = self.unpack(current)
+                vis.draw_explored(cx, cy)
+                vis.update()
+
+            d = dist[current] + 1
+            for v in self.get_neighbor_indices(current):
+                if dist[v] >= 0:
+                    continue
+                dist[v] = d
+                parent[v] = current
+                next_frontier.append(v)
+
+                # Reached by the other side too: candidate joined path
+                if other_dist[v] >= 0:
+                    total = d + other_dist[v]
+                    if best < 0 or total < best:
+                        best, meet = total, v
+                elif vis:
+                    vis.draw_frontier(*self.unpack(v))
+
+        return next_frontier, meet
+
+    def join_paths(self, parent_f, parent_b, meet):
+        """
+        Join the two half-paths through the cell where the searches met.
+
+        Args:
+            parent_f: Forward parent table (towards the start)
+            parent_b: Backward parent table (towards the goal)
+            meet: Packed index of the meeting cell
+
+        Returns:
+            List of (x, y) tuples from start to goal
+        """
+        path = []
+        current = meet
+        while current != -1:
+            path.append(self.unpack(current))
+            current = parent_f[current]
+        path.reverse()
+
+        current = parent_b[meet]
+        while current != -1:
+            path.append(self.unpack(current))
+            current = parent_b[current]
+        return path
@@ -9,6 +9,7 @@ frontier management.
 """
 
 from .planner import Planner
+import numpy as np
 
 # ============================================================================
 # DFSPlanner_graphbased Class - Graph-based Depth-First Search Implementation
@@ -41,7 +42,7 @@ class DFSPlanner_graphbased(Planner):
         """
         super().__init__(grid_map, motion_model, visualizer)
         self.expanded_count = 0  # Total number of nodes expanded during search
-        self.expansion_map = {}  # Tracks how many times each state was expanded
+        self.expansion_grid = np.zeros((grid_map.height, grid_map.width), dtype=np.int32)  # Per-cell expansion counts, indexed [y, x]
         self.debug = debug
 
     # ========================================================================
@@ -64,29 +65,13 @@ class DFSPlanner_graphbased(Planner):
             - "8n": 8-connected (includes diagonal moves)
         """
 
-        # Define movement patterns based on motion model
-        if self.motion_model == "4n":
-            # 4-connected: only cardinal directions
-            moves = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-        else:  # 8-connected
-            # 8-connected: cardinal + diagonal directions
-            moves = [
-                (1, 0), (-1, 0), (0, 1), (0, -1),  # Cardinal directions
-                (1, 1), (1, -1), (-1, 1), (-1, -1)  # Diagonal directions
-            ]
-
-        # Check each potential move
-        for dx, dy in moves:
+        free = self._free_moves[gy][gx]
+        for k, (dx, dy) in enumerate(self._moves):
             nx, ny = gx + dx, gy + dy
-
-            # Skip invalid neighbors
-            if not self.grid_map.is_inside(nx, ny):
-                continue
-            if self.grid_map.is_obstacle(nx, ny):
-                continue
-            if self.grid_map.is_inflated(nx, ny):
+            # Skip if outside the grid, on an obstacle or blocked by inflation
+            if not free >> k & 1:
                 if self.visualizer:
-                    self.visualizer.draw_inflated(nx, ny)
+                    self._draw_if_inflated(nx, ny)
                 continue
 
             yield (nx, ny)
@@ -116,6 +101,7 @@ class DFSPlanner_graphbased(Planner):
         - Each state explored at most once
         - Uses stack (LIFO) for frontier management
         - Parent dictionary maps state to parent state for path reconstruction
+        - States are keyed by packed index (y * width + x) instead of tuples
         
         Args:
             start: Starting position as (x, y) tuple
@@ -126,15 +112,22 @@ class DFSPlanner_graphbased(Planner):
         """
 
         vis = self.visualizer
+        unpack = self.unpack
+
+        start_i = self.pack(*start)
+        goal_i = self.pack(*goal)
 
         # Initialize frontier stack with start state
-        OPEN = [(start, None)]     # Stack of (state, parent) tuples
-        OPEN_SET = {start}  # Set to track states in OPEN for O(1) lookup
+        OPEN = [(start_i, None)]     # Stack of (state, parent) tuples
+        OPEN_SET = {start_i}  # Set to track states in OPEN for O(1) lookup
         parent = {}  # Dictionary mapping state -> parent state for path reconstruction
 
         # Initialize closed set to track visited states
         CLOSED = set()  # Set of visited states (prevents revisiting)
 
+        # Flat view of the expansion counts, indexed by packed index
+        expansions = self.expansion_grid.reshape(-1)
+
         if self.debug:
             print("\n[DFS] START =", start, "GOAL =", goal)
 
@@ -146,14 +139,14 @@ class DFSPlanner_graphbased(Planner):
         # Main search loop
         while OPEN:
             if self.debug:
-                print("[DFS] STACK (top last):", [s for s, _ in OPEN])
+                print("[DFS] STACK (top last):", [unpack(s) for s, _ in OPEN])
             
             # Pop the last node from stack (LIFO)
             v, p = OPEN.pop()
             OPEN_SET.remove(v)
             
             if self.debug:
-                print("[DFS] EXPAND:", v)
+                print("[DFS] EXPAND:", unpack(v))
 
             # Skip if already expanded (duplicate in stack)
             if v in CLOSED:
@@ -163,21 +156,16 @@ class DFSPlanner_graphbased(Planner):
             if p is not None:
                 parent[v] = p
 
-            # Extract coordinates from state
-            cx, cy = v
-
             # Track expansion statistics
             self.expanded_count += 1
-            self.expansion_map[(cx, cy)] = (
-                self.expansion_map.get((cx, cy), 0) + 1
-            )
+            expansions[v] += 1
 
             # Update visualization
             if vis:
-                vis.draw_explored(cx, cy)
+                vis.draw_explored(*unpack(v))
 
                 # Visualize partial path from start to current node
-                partial = self.build_partial_path(parent, start, v)
+                partial = self.build_partial_path(parent, start_i, v)
                 for i in range(len(partial) - 1):
                     x1, y1 = partial[i]
                     x2, y2 = partial[i + 1]
@@ -186,23 +174,23 @@ class DFSPlanner_graphbased(Planner):
                 vis.update()
 
             # Check if goal reached
-            if v == goal:
-                return self.reconstruct_path(parent, start, goal)
+            if v == goal_i:
+                return self.reconstruct_path(parent, start_i, goal_i)
 
             # Mark state as visited
             CLOSED.add(v)
 
             # Generate and process all valid neighbors
-            for child in self.get_neighbors(cx, cy):
+            for child in self.get_neighbor_indices(v):
                 # Only add child if not already visited or in frontier
                 if child not in CLOSED and child not in OPEN_SET:
                     if self.debug:
-                        print("    [DFS] PUSH:", child)
+                        print("    [DFS] PUSH:", unpack(child))
                     OPEN.append((child, v))
                     OPEN_SET.add(child)
 
                     if vis:
-                        vis.draw_frontier(child[0], child[1])
+                        vis.draw_frontier(*unpack(child))
 
         # No path found
         return None
@@ -216,19 +204,19 @@ class DFSPlanner_graphbased(Planner):
         Traces backwards from goal to start by following parent pointers.
         
         Args:
-            parent: Dictionary mapping state -> parent state
-            start: Starting position as (x, y) tuple
-            goal: Goal position as (x, y) tuple
+            parent: Dictionary mapping packed state -> packed parent state
+            start: Packed index of the starting position
+            goal: Packed index of the goal position
         
         Returns:
             List of coordinates representing the complete path from start to goal
         """
-        path = [goal]  # Start with goal
+        path = [self.unpack(goal)]  # Start with goal
         cur = goal
         # Trace backwards through parent pointers until reaching start
         while cur != start:
             cur = parent[cur]  # Move to parent state
-            path.append(cur)  # Add to path
+            path.append(self.unpack(cur))  # Add to path
         path.reverse()  # Reverse to get path from start to goal
         return path
 
@@ -238,18 +226,18 @@ class DFSPlanner_graphbased(Planner):
         Used during search to show the current path being explored.
         
         Args:
-            parent: Dictionary mapping state -> parent state
-            start: Starting position as (x, y) tuple
-            current: Current position as (x, y) tuple
+            parent: Dictionary mapping packed state -> packed parent state
+            start: Packed index of the starting position
+            current: Packed index of the current position
         
         Returns:
             List of coordinates representing path from start to current state
         """
-        path = [current]  # Start with current state
+        path = [self.unpack(current)]  # Start with current state
         # Trace backwards through parent pointers until reaching start
         while current in parent:
             current = parent[current]  # Move to parent state
-            path.append(current)  # Add to path
+            path.append(self.unpack(current))  # Add to path
             if current == start:
                 break  # Stop when we reach the start
         path.reverse()  # Reverse to get path from start to current
@@ -9,6 +9,7 @@ DFS explores deeply before backtracking, using a stack (LIFO) for frontier manag
 """
 
 from .planner import Planner
+import numpy as np
 
 class DFSNode:
     """
@@ -47,7 +48,7 @@ class DFSPlanner_treebased(Planner):
         super().__init__(grid_map, motion_model, visualizer)
         # Statistics for comparison and analysis
         self.expanded_count = 0
-        self.expansion_map = {}
+        self.expansion_grid = np.zeros((grid_map.height, grid_map.width), dtype=np.int32)
         self.max_expansions = max_expansions
         self.debug = debug
 
@@ -66,30 +67,13 @@ class DFSPlanner_treebased(Planner):
         Yields:
             Tuple (nx, ny) for each valid neighbor
         """
-        # Define movement patterns based on motion model
-        if self.motion_model == "4n":
-            # 4-neighbor: up, down, left, right only
-            moves = [(1,0), (-1,0), (0,1), (0,-1)]
-        else:
-            # 8-neighbor: includes diagonal movements
-            moves = [
-                (1,0), (-1,0), (0,1), (0,-1),
-                (1,1), (1,-1), (-1,1), (-1,-1)
-            ]
-
-        for dx, dy in moves:
+        free = self._free_moves[gy][gx]
+        for k, (dx, dy) in enumerate(self._moves):
             nx, ny = gx + dx, gy + dy
-
-            # Skip if outside grid boundaries
-            if not self.grid_map.is_inside(nx, ny):
-                continue
-            # Skip if directly on an obstacle
-            if self.grid_map.is_obstacle(nx, ny):
-                continue
-            # Skip if blocked by inflated obstacle (robot too large to fit)
-            if self.grid_map.is_inflated(nx, ny):
+            # Skip if outside the grid, on an obstacle or blocked by inflation
+            if not free >> k & 1:
                 if self.visualizer:
-                    self.visualizer.draw_inflated(nx, ny)
+                    self._draw_if_inflated(nx, ny)
                 continue
 
             yield (nx, ny)
@@ -197,7 +181,7 @@ class DFSPlanner_treebased(Planner):
 
             # Track expansion statistics
             self.expanded_count += 1
-            self.expansion_map[v] = self.expansion_map.get(v, 0) + 1
+            self.expansion_grid[v[1], v[0]] += 1
 
             # Visualization: show explored state and current path
             if vis:
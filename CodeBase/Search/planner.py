@@ -6,6 +6,111 @@ inherit from. It provides a common interface for different search algorithms
 (A*, BFS, DFS) to work with the navigation system.
 """
 
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+
+def grid_heuristic(dx, dy, res, motion_model):
+    """
+    Admissible grid distance estimate used by the A* planners.
+    
+    For 4-neighbor movement this is the Manhattan distance; for 8-neighbor
+    movement the octile distance, which accounts for diagonal moves.
+    
+    Args:
+        dx, dy: Absolute cell differences along x and y
+        res: Grid resolution (scales the result to world units)
+        motion_model: "4n" or "8n"
+        
+    Returns:
+        Estimated cost of moving dx, dy cells
+    """
+    if motion_model == "4n":
+        # Manhattan distance: sum of horizontal and vertical distances
+        return (dx + dy) * res
+    # Octile distance: accounts for diagonal movement in 8-neighbor grids
+    # This is more accurate than Euclidean for grid-based pathfinding
+    return (max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy)) * res
+
+
+@lru_cache(maxsize=8)
+def heuristic_table(width, height, goal, res, motion_model):
+    """
+    Heuristic from every cell of a grid to a goal, as a flat lookup table.
+    
+    The values equal grid_heuristic for each cell but are computed for the
+    whole grid in a few array operations. Tables are cached, so the A*
+    variants run on the same map and goal (graph and tree search, timed
+    and memory runs) share one table. The result is a tuple because it is
+    shared.
+    
+    Args:
+        width, height: Grid size in cells
+        goal: Tuple (x, y) goal position
+        res: Grid resolution (scales the result to world units)
+        motion_model: "4n" or "8n"
+        
+    Returns:
+        Tuple of floats indexed by y * width + x
+    """
+    dx = np.abs(np.arange(width) - goal[0])[np.newaxis, :]
+    dy = np.abs(np.arange(height) - goal[1])[:, np.newaxis]
+    if motion_model == "4n":
+        h = (dx + dy) * res
+    else:
+        h = (np.maximum(dx, dy) + (math.sqrt(2) - 1) * np.minimum(dx, dy)) * res
+    return tuple(h.ravel().tolist())
+
+
+def free_move_table(grid_map, motion_model):
+    """
+    Free-neighbor bitmasks of every cell of a grid map, as nested lists.
+    
+    The table only depends on the map's occupancy and the motion model, so
+    it is built once and kept on the map (GridMap.free_moves_cache, cleared
+    whenever the occupancy changes). All planners run on the same map share
+    it instead of each scanning the whole grid again. The lists are shared
+    and must not be modified.
+    
+    Args:
+        grid_map: GridMap to build the table for
+        motion_model: "4n" or "8n"
+        
+    Returns:
+        List of rows [y][x]; bit k of an entry is set if move k of
+        Planner.DX/DY leads to a free in-bounds cell
+    """
+    n_moves = 4 if motion_model == "4n" else 8
+    table = grid_map.free_moves_cache.get(n_moves)
+    if table is None:
+        table = Planner._free_move_masks(grid_map.occ, n_moves).tolist()
+        grid_map.free_moves_cache[n_moves] = table
+    return table
+
+
+@dataclass
+class PlanResult:
+    """
+    Outcome of a single planner run.
+    
+    Bundles the path with the search statistics so callers don't have to
+    read them back from the planner object one attribute at a time.
+    
+    Planners return a path only when the goal was reached (partial paths
+    are for visualization only), so reached_goal is derived from the path:
+    it is simply ``path is not None``.
+    """
+    path: list | None              # List of (x, y) tuples, or None if no path
+    reached_goal: bool             # path is not None
+    expanded_count: int            # Total number of node expansions
+    expansion_xs: np.ndarray       # x of every expanded cell (int32)
+    expansion_ys: np.ndarray       # y of every expanded cell (int32)
+    expansion_counts: np.ndarray   # Expansion count per (x, y) entry
+
+
 class Planner:
     """
     Abstract base class for all path planning algorithms.
@@ -15,6 +120,12 @@ class Planner:
     The planner works with a grid map and can optionally use a visualizer for
     real-time visualization of the search process.
     """
+
+    # Neighbor offsets in the order planners expand them. The first four are
+    # the 4-neighbor moves; all eight are used for 8-neighbor motion.
+    DX = np.array([1, -1, 0, 0, 1, 1, -1, -1], dtype=np.int8)
+    DY = np.array([0, 0, 1, -1, 1, -1, 1, -1], dtype=np.int8)
+
     def __init__(self, grid_map, motion_model="8n", visualizer=None):
         """
         Initialize the planner with a grid map and configuration.
@@ -28,6 +139,178 @@ class Planner:
         self.visualizer = visualizer
         self.motion_model = motion_model
 
+        # Packed occupancy array (obstacle bit 0, inflated bit 1)
+        self._occ = grid_map.occ
+
+        # Moves for the motion model and, per cell, a bitmask of which of
+        # them lead to a free in-bounds neighbor (bit k <-> self._moves[k]).
+        # Computed once for the whole grid so an expansion only reads one
+        # value instead of checking each neighbor separately (shared, see
+        # free_move_table).
+        n_moves = 4 if motion_model == "4n" else 8
+        self._moves = list(zip(self.DX[:n_moves].tolist(), self.DY[:n_moves].tolist()))
+        self._free_moves = free_move_table(grid_map, motion_model)
+
+        # Cells can also be keyed by a packed index i = y * width + x; moving
+        # by (dx, dy) then adds dy * width + dx to the index
+        self._width = grid_map.width
+        self._offsets = [dy * self._width + dx for dx, dy in self._moves]
+
+    @classmethod
+    def _free_move_masks(cls, occ, n_moves):
+        """
+        Compute the free-neighbor bitmask of every cell at once.
+        
+        Args:
+            occ: Packed occupancy array of the grid map (0 = traversable)
+            n_moves: Number of moves (4 or 8) taken from DX/DY
+            
+        Returns:
+            (height, width) uint8 array; bit k is set if the cell reached with
+            move k is inside the grid and neither an obstacle nor inflated
+        """
+        h, w = occ.shape
+        # Pad with blocked cells so moves off the grid read as not free
+        padded = np.ones((h + 2, w + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = occ
+
+        masks = np.zeros((h, w), dtype=np.uint8)
+        for k in range(n_moves):
+            dx, dy = int(cls.DX[k]), int(cls.DY[k])
+            shifted = padded[1 + dy:1 + dy + h, 1 + dx:1 + dx + w]
+            masks[shifted == 0] |= np.uint8(1 << k)
+        return masks
+
+    def pack(self, x, y):
+        """
+        Pack cell coordinates into a single integer key.
+        
+        Int keys hash faster than (x, y) tuples and need no allocation,
+        which matters for the sets and dicts in the search loops.
+        
+        Args:
+            x, y: Cell coordinates
+            
+        Returns:
+            Packed index y * width + x
+        """
+        return y * self._width + x
+
+    def unpack(self, i):
+        """
+        Decode a packed cell index back into coordinates.
+        
+        Args:
+            i: Packed index as returned by pack()
+            
+        Returns:
+            Tuple (x, y)
+        """
+        y, x = divmod(i, self._width)
+        return x, y
+
+    def get_neighbor_indices(self, i):
+        """
+        Generate valid neighbors of a cell as packed indices.
+        
+        Same neighbors and order as get_neighbors, for planners that key
+        their search state by packed index.
+        
+        Args:
+            i: Packed index of the current cell
+            
+        Yields:
+            Packed index of each valid neighbor
+        """
+        gy, gx = divmod(i, self._width)
+        free = self._free_moves[gy][gx]
+        for k, offset in enumerate(self._offsets):
+            # Skip if outside the grid, on an obstacle or blocked by inflation
+            if not free >> k & 1:
+                if self.visualizer:
+                    dx, dy = self._moves[k]
+                    self._draw_if_inflated(gx + dx, gy + dy)
+                continue
+
+            yield i + offset
+
+    def _draw_if_inflated(self, nx, ny):
+        """
+        Show a rejected neighbor on the visualizer if it is an inflated cell.
+        
+        Args:
+            nx, ny: Coordinates of the rejected neighbor
+        """
+        if self.grid_map.is_inside(nx, ny) and self._occ.item(ny, nx) == self.grid_map.INFLATED:
+            self.visualizer.draw_inflated(nx, ny)
+
+    def heuristic(self, a, b):
+        """
+        Calculate the heuristic (estimated cost) from point a to point b.
+        
+        The heuristic must be admissible (never overestimate) for A* to find
+        optimal paths. See grid_heuristic for the distance used per motion
+        model.
+        
+        Args:
+            a: Start position (x, y)
+            b: Goal position (x, y)
+            
+        Returns:
+            Estimated cost from a to b (scaled by grid resolution)
+        """
+        return grid_heuristic(
+            abs(a[0] - b[0]), abs(a[1] - b[1]),
+            self.grid_map.resolution, self.motion_model
+        )
+
+    def reset_heuristic_cache(self, goal):
+        """
+        Load the per-cell heuristic table for a new goal.
+        
+        Args:
+            goal: Tuple (x, y) goal position of the upcoming search
+        """
+        self._h_cache = heuristic_table(
+            self.grid_map.width, self.grid_map.height, (goal[0], goal[1]),
+            self.grid_map.resolution, self.motion_model
+        )
+
+    def cached_heuristic(self, x, y):
+        """
+        Heuristic from cell (x, y) to the goal of the current search.
+        
+        A cell can be relaxed many times during a search, so its heuristic
+        value is read from the flat table of heuristic_table instead of
+        being recomputed (see reset_heuristic_cache).
+        
+        Args:
+            x, y: Cell coordinates
+            
+        Returns:
+            Estimated cost from (x, y) to the goal
+        """
+        return self._h_cache[y * self._width + x]
+
+    def path_cost(self, path):
+        """
+        Total movement cost of a path under the A* step costs.
+        
+        Straight moves cost one grid resolution and diagonal moves sqrt(2)
+        times that, as in the A* planners' cost(). All steps are priced in
+        one pass over the path array instead of one cost() call per step.
+        
+        Args:
+            path: List of (x, y) grid cells from start to goal
+            
+        Returns:
+            Sum of the step costs (0.0 for a path with a single cell)
+        """
+        steps = np.diff(np.asarray(path), axis=0)
+        diagonal = (steps[:, 0] != 0) & (steps[:, 1] != 0)
+        res = self.grid_map.resolution
+        return float(np.where(diagonal, math.sqrt(2) * res, 1 * res).sum())
+
     def plan(self, start, goal):
         """
         Plan a path from start to goal.
@@ -43,4 +326,138 @@ class Planner:
         Returns:
             List of (x, y) tuples representing the path, or None if no path found
         """
-        raise NotImplementedError("plan() must be implemented by subclasses")
\ No newline at end of file
+        raise NotImplementedError("plan() must be implemented by subclasses")
+
+    def plan_result(self, start, goal):
+        """
+        Plan a path and return it together with the search statistics.
+        
+        Args:
+            start: Tuple (x, y) representing the start position
+            goal: Tuple (x, y) representing the goal position
+            
+        Returns:
+            PlanResult for this run (reached_goal is ``path is not None``)
+        """
+        path = self.plan(start, goal)
+        xs, ys, counts = self.expansion_arrays()
+        return PlanResult(
+            path=path,
+            reached_goal=path is not None,
+            expanded_count=self.expanded_count,
+            expansion_xs=xs,
+            expansion_ys=ys,
+            expansion_counts=counts,
+        )
+
+    def expansion_arrays(self):
+        """
+        Get the expansion statistics as parallel coordinate/count arrays.
+        
+        Subclasses count expansions per cell in self.expansion_grid, a
+        (height, width) int32 array. This returns only the cells that were
+        expanded at least once, which is much smaller than the full grid
+        for typical searches.
+        
+        Returns:
+            Tuple (xs, ys, counts) of int32 arrays with one entry per
+            expanded cell
+        """
+        ys, xs = np.nonzero(self.expansion_grid)
+        counts = self.expansion_grid[ys, xs]
+        return xs.astype(np.int32), ys.astype(np.int32), counts
+
+    def reconstruct_path_3d(self, parent, start, goal, vid):
+        """
+        Reconstruct the full path from goal back to start using 3D parent pointers.
+        
+        Shared by the tree-based planners. Since tree-based search uses visit
+        IDs, we need to follow both the state and visit ID through the parent
+        chain. Includes loop detection for safety.
+        
+        Args:
+            parent: 3D parent dictionary
+            start: Start position
+            goal: Goal position
+            vid: Visit ID of the goal node
+            
+        Returns:
+            List of (x, y) tuples representing the complete path
+        """
+        path = []
+        cur_state = goal
+        cur_vid = vid
+
+        visited = set()
+
+        while True:
+            path.append(cur_state)
+
+            if cur_state == start:
+                break
+
+            # detect loops
+            if (cur_state, cur_vid) in visited:
+                print("[ERROR] Loop detected in 3D final path!")
+                break
+
+            visited.add((cur_state, cur_vid))
+
+            # validate parent entry
+            if cur_state not in parent or cur_vid not in parent[cur_state]:
+                print("[ERROR] Missing parent link in 3D final path. Returning partial path.")
+                break
+
+            # follow parent
+            prev_state, prev_vid = parent[cur_state][cur_vid]
+
+            cur_state = prev_state
+            cur_vid = prev_vid
+
+        return list(reversed(path))
+
+    def build_partial_path_3d(self, parent, start, state, vid):
+        """
+        Build a partial path from the given state back to start for visualization.
+        
+        Used during search to show the current best path to any node being explored.
+        Includes loop detection to prevent infinite loops in visualization.
+        
+        Args:
+            parent: 3D parent dictionary
+            start: Start position
+            state: Current state to build path from
+            vid: Visit ID of the current state
+            
+        Returns:
+            List of (x, y) tuples representing the partial path
+        """
+        path = []
+        cur_state = state
+        cur_vid = vid
+        
+        visited = set()
+
+        while True:
+            path.append(cur_state)
+
+            if cur_state == start:
+                break
+
+            # detect infinite loops
+            if (cur_state, cur_vid) in visited:
+                print("[WARN] Loop in partial 3D path — breaking early.")
+                break
+
+            visited.add((cur_state, cur_vid))
+
+            if cur_state not in parent or cur_vid not in parent[cur_state]:
+                print("[WARN] Missing parent in partial 3D path — breaking early.")
+                break
+
+            prev_state, prev_vid = parent[cur_state][cur_vid]
+
+            cur_state = prev_state
+            cur_vid = prev_vid
+
+        return list(reversed(path))
@@ -1,32 +1,111 @@
 """
 Heatmap Utilities - Expansion Map Conversion
 
-This module provides utilities for converting sparse expansion maps (dictionaries
-mapping cell coordinates to expansion counts) into dense numpy arrays suitable
-for visualization as heatmaps.
+This module provides utilities for converting sparse expansion statistics
+(parallel arrays of cell coordinates and expansion counts) into dense numpy
+arrays suitable for visualization as heatmaps.
 """
 
 import numpy as np
 
-def expansion_map_to_array(expansion_map, width, height):
+def expansions_to_array(xs, ys, counts, width, height, out=None):
     """
-    Convert sparse expansion map to dense heatmap array.
+    Convert sparse expansion arrays to a dense heatmap array.
     
-    Takes a dictionary mapping (x, y) coordinates to expansion counts and
-    converts it to a 2D numpy array where each cell contains the number of
-    times it was expanded during search. This is used for visualizing search
-    behavior as heatmaps.
+    Takes parallel arrays of cell coordinates and expansion counts (as
+    returned by Planner.expansion_arrays) and scatters them into a 2D numpy
+    array where each cell contains the number of times it was expanded
+    during search. This is used for visualizing search behavior as heatmaps.
     
     Args:
-        expansion_map: Dictionary mapping (x, y) tuples to expansion counts
+        xs: Array of x coordinates of expanded cells
+        ys: Array of y coordinates of expanded cells
+        counts: Array of expansion counts, one per (x, y) entry
         width: Width of the grid
         height: Height of the grid
+        out: Optional integer array of shape (height, width) to reuse; it
+            is zeroed and filled instead of allocating a new array. A
+            narrower dtype than int32 is fine if the counts fit in it
         
     Returns:
         2D numpy array with expansion counts, shape (height, width)
+        (out, if it was given)
     """
-    heat = np.zeros((height, width), dtype=np.int32)
-    for (x, y), c in expansion_map.items():
-        if 0 <= x < width and 0 <= y < height:
-            heat[y, x] = c
+    xs = np.asarray(xs, dtype=np.intp)
+    ys = np.asarray(ys, dtype=np.intp)
+    counts = np.asarray(counts, dtype=np.int32)
+
+    if out is None:
+        heat = np.zeros((height, width), dtype=np.int32)
+    else:
+        heat = out
+        heat.fill(0)
+    mask = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    heat[ys[mask], xs[mask]] = counts[mask]
     return heat
+
+
+def save_expansions(path, xs, ys, counts, width, height, grid_path=None):
+    """
+    Write expansion statistics to an .npz heatmap file in sparse (COO) form.
+    
+    Stores the parallel coordinate/count arrays as they come from the
+    planner, so no dense (height, width) array has to be built. Rows,
+    columns and counts use the smallest unsigned integer types that hold
+    them, and files stay small without the cost of compressing them.
+    load_heatmap restores the dense heatmap. The planner's path can be
+    stored in the same file and read back with load_grid_path.
+    
+    Args:
+        path: Destination file path (should end in .npz)
+        xs: Array of x coordinates of expanded cells
+        ys: Array of y coordinates of expanded cells
+        counts: Array of expansion counts, one per (x, y) entry
+        width: Width of the grid
+        height: Height of the grid
+        grid_path: Optional list of (x, y) cells of the found path
+    """
+    counts = np.asarray(counts)
+    coord_type = np.min_scalar_type(max(width, height))
+    arrays = {
+        "rows": np.asarray(ys).astype(coord_type),
+        "cols": np.asarray(xs).astype(coord_type),
+        "vals": counts.astype(np.min_scalar_type(counts.max(initial=0))),
+        "shape": np.asarray((height, width)),
+    }
+    if grid_path is not None:
+        arrays["grid_path"] = np.asarray(grid_path, dtype=coord_type).reshape(-1, 2)
+    np.savez(path, **arrays)
+
+
+def load_heatmap(path, out=None):
+    """
+    Read a heatmap written by save_expansions.
+    
+    Args:
+        path: Path of the .npz file
+        out: Optional integer buffer of the heatmap's shape to read into
+            (see expansions_to_array)
+        
+    Returns:
+        2D numpy array with expansion counts (int32, or out's dtype)
+    """
+    with np.load(path) as data:
+        height, width = data["shape"].tolist()
+        return expansions_to_array(data["cols"], data["rows"], data["vals"], width, height, out=out)
+
+
+def load_grid_path(path):
+    """
+    Read the path stored alongside a heatmap by save_expansions.
+    
+    Args:
+        path: Path of the .npz file
+        
+    Returns:
+        (N, 2) array of (x, y) path cells, or None if no path was stored
+    """
+    with np.load(path) as data:
+        if "grid_path" not in data:
+            return None
+        return data["grid_path"]
@@ -6,17 +6,23 @@ testing and experimentation. It creates grids with random obstacle placements,
 ensures valid start/goal positions, and handles obstacle inflation.
 """
 
+import os
+
 import numpy as np
-import random
 
 from CodeBase.Environment.grid_map import GridMap
 from CodeBase.Environment.world_map import WorldMap
 from CodeBase.Environment.mobile_robot import MobileRobot
 from CodeBase.Environment.inflator import ObstacleInflator
-from CodeBase.Environment.obstacle import Obstacle
 
 
-def generate_random_grid(size: int, obstacle_ratio: float) -> np.ndarray:
+# Module random generator (PCG64). Seeded from the BENCH_SEED environment
+# variable for reproducible benchmark runs, otherwise from OS entropy.
+_bench_seed = os.environ.get("BENCH_SEED")
+_RNG = np.random.default_rng(int(_bench_seed) if _bench_seed else None)
+
+
+def generate_random_grid(size: int, obstacle_ratio: float, rng=None) -> np.ndarray:
     """
     Create a random grid with boundary walls.
     
@@ -27,15 +33,13 @@ def generate_random_grid(size: int, obstacle_ratio: float) -> np.ndarray:
     Args:
         size: Grid size (creates size x size grid)
         obstacle_ratio: Probability that a cell is an obstacle (0.0 to 1.0)
+        rng: Optional numpy Generator (defaults to the module generator)
         
     Returns:
-        2D numpy array with 0 = free, 1 = obstacle
+        2D uint8 numpy array with 0 = free, 1 = obstacle
     """
-    grid = np.random.choice(
-        [0, 1],
-        size=(size, size),
-        p=[1 - obstacle_ratio, obstacle_ratio]
-    ).astype(int)
+    rng = _RNG if rng is None else rng
+    grid = (rng.random((size, size)) < obstacle_ratio).astype(np.uint8)
 
     # force boundary walls
     grid[0, :] = 1
@@ -46,63 +50,73 @@ def generate_random_grid(size: int, obstacle_ratio: float) -> np.ndarray:
     return grid
 
 
-def grid_to_obstacles(grid: np.ndarray):
+def grid_to_obstacle_coords(grid: np.ndarray):
     """
-    Convert obstacle cells in a grid array to Obstacle objects.
-    
-    Scans the grid array and creates an Obstacle object for each cell
-    that has value 1 (obstacle).
-    
+    Get the grid coordinates of all obstacle cells as numpy arrays.
+
+    Fast path for callers that work on separate x and y coordinate arrays
+    (e.g. obstacle inflation).
+
     Args:
         grid: 2D numpy array with 0 = free, 1 = obstacle
-        
+
+    Returns:
+        Tuple (xs, ys) of int32 arrays, in row-major order
+    """
+    ys, xs = np.nonzero(grid == 1)
+    return xs.astype(np.int32), ys.astype(np.int32)
+
+
+def grid_to_obstacle_array(grid: np.ndarray):
+    """
+    Get all obstacle cells as a compact (N, 2) coordinate array.
+
+    This is the obstacle representation used for generated environments:
+    one int32 (gx, gy) row per obstacle instead of one Python object each,
+    which is far smaller to keep around and to pickle into worker processes.
+
+    Args:
+        grid: 2D numpy array with 0 = free, 1 = obstacle
+
     Returns:
-        List of Obstacle objects with their grid coordinates
+        (N, 2) int32 array of (gx, gy) rows, in row-major order
     """
-    obstacles = []
-    h, w = grid.shape
-    for y in range(h):
-        for x in range(w):
-            if grid[y, x] == 1:
-                obstacles.append(Obstacle(x, y))
-    return obstacles
+    return np.stack(grid_to_obstacle_coords(grid), axis=1)
 
 
-def pick_start_goal(grid_map, max_tries=5_000):
+def pick_start_goal(grid_map, rng=None):
     """
     Pick valid start and goal positions from safe cells.
     
     Randomly selects two distinct safe cells (not obstacles, not inflated)
-    to use as start and goal positions. Tries multiple times to ensure
-    they are distinct.
+    to use as start and goal positions. The safe cells are found with a
+    boolean mask over the grid and sampled without replacement, so start
+    and goal are always distinct.
     
     Args:
         grid_map: GridMap to pick positions from
-        max_tries: Maximum number of attempts to find distinct positions
+        rng: Optional numpy Generator (defaults to the module generator)
         
     Returns:
         Tuple ((start_x, start_y), (goal_x, goal_y))
         
     Raises:
-        RuntimeError: If not enough safe cells or can't find distinct positions
+        RuntimeError: If there are fewer than two safe cells
     """
-    safe_cells = [
-        (x, y)
-        for y in range(grid_map.height)
-        for x in range(grid_map.width)
-        if not grid_map.is_obstacle(x, y)
-        and not grid_map.is_inflated(x, y)
-    ]
-
-    if len(safe_cells) < 2:
+    safe_mask = (grid_map.grid == 0) & ~grid_map.inflated_grid
+
+    safe_idxs = np.flatnonzero(safe_mask)
+
+    if len(safe_idxs) < 2:
         raise RuntimeError("Not enough safe cells for start/goal")
 
-    for _ in range(max_tries):
-        start, goal = random.sample(safe_cells, 2)
-        if start != goal:
-            return start, goal
+    rng = _RNG if rng is None else rng
+    pick = rng.choice(safe_idxs, size=2, replace=False)
+    ys, xs = np.divmod(pick, grid_map.width)
 
-    raise RuntimeError("Failed to pick distinct start/goal")
+    start = (int(xs[0]), int(ys[0]))
+    goal = (int(xs[1]), int(ys[1]))
+    return start, goal
 
 def create_random_grid_environment(
     size: int,
@@ -110,6 +124,7 @@ def create_random_grid_environment(
     robot_radius: float,
     resolution: float = 1.0,
     max_retries: int = 5,
+    rng=None,
 ):
     """
     Create a complete random grid environment ready for path planning.
@@ -124,9 +139,13 @@ def create_random_grid_environment(
         robot_radius: Robot radius in world units
         resolution: Grid cell size in world units
         max_retries: Maximum number of attempts if generation fails
+        rng: Optional numpy Generator for the grid and start/goal draws,
+            e.g. one per map from SeedSequence.spawn (defaults to the
+            module generator)
         
     Returns:
-        Tuple (grid_map, world_map, robot, obstacles)
+        Tuple (grid_map, world_map, robot, obstacles), where obstacles is
+        an (N, 2) int32 array of obstacle (gx, gy) coordinates
         
     Raises:
         RuntimeError: If generation fails after max_retries attempts
@@ -144,8 +163,8 @@ def create_random_grid_environment(
                 f"resolution={resolution}"
             )
 
-            grid_array = generate_random_grid(size, obstacle_ratio)
-            obstacles = grid_to_obstacles(grid_array)
+            grid_array = generate_random_grid(size, obstacle_ratio, rng)
+            obstacles = grid_to_obstacle_array(grid_array)
 
             grid_map = GridMap(grid_array, resolution=resolution)
             world_map = WorldMap(origin=(0, 0), resolution=resolution)
@@ -157,15 +176,11 @@ def create_random_grid_environment(
             inflator = ObstacleInflator(robot_radius)
             inflator.inflate(grid_map, world_map, obstacles)
 
-            inflated_count = sum(
-                grid_map.is_inflated(x, y)
-                for y in range(grid_map.height)
-                for x in range(grid_map.width)
-            )
+            inflated_count = int(np.count_nonzero(grid_map.inflated_grid))
             print("[GRID FACTORY] inflated cells =", inflated_count)
 
             # ---- START / GOAL PICK ----
-            start, goal = pick_start_goal(grid_map)
+            start, goal = pick_start_goal(grid_map, rng)
 
             # HARD GUARANTEE
             if start == goal:
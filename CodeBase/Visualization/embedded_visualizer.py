@@ -288,3 +288,13 @@ class EmbeddedVisualizer:
 
     def show(self):
         pass
+
+    def close(self):
+        """
+        Release the matplotlib figure.
+        
+        The figure is created through pyplot, which keeps it alive until it
+        is closed explicitly; destroying the Tk canvas widget alone does not
+        free it.
+        """
+        plt.close(self.fig)
@@ -6,12 +6,16 @@ process. It takes a pre-configured environment and execution settings, then runs
 appropriate search algorithm to find a path from start to goal.
 
 The system supports multiple planners (A*, BFS, DFS) with both graph-based and
-tree-based search modes, and can work with or without visualization.
+tree-based search modes, plus a graph-based bidirectional BFS, and can work with
+or without visualization.
 """
 
+import numpy as np
+
 from CodeBase.Search.astar_graph_based import AStarPlanner_graphbased
 from CodeBase.Search.astar_tree_based import AStarPlanner_treebased
 from CodeBase.Search.bfs import BFSPlanner_graphbased, BFSPlanner_treesearch
+from CodeBase.Search.bidirectional_bfs import BidirectionalBFSPlanner
 from CodeBase.Search.dfs_graph_based import DFSPlanner_graphbased
 from CodeBase.Search.dfs_tree_based import DFSPlanner_treebased
 
@@ -38,9 +42,9 @@ class NavigationSystem:
                 - "grid_map": GridMap object representing the grid world
                 - "world_map": WorldMap object for coordinate transformations
                 - "robot": MobileRobot object with start/goal positions
-                - "obstacles": List of Obstacle objects in the environment
+                - "obstacles": (N, 2) array of obstacle (gx, gy) coordinates
             exec_config: Dictionary with execution settings:
-                - "planner": Algorithm name ("Astar", "BFS", or "DFS")
+                - "planner": Algorithm name ("Astar", "BFS", "DFS" or "BiBFS")
                 - "motion": Motion model ("4n" for 4-neighbor, "8n" for 8-neighbor)
                 - "use_tree_search": True for tree-based, False for graph-based search
                 - "visualize_search": Whether to show visualization during search
@@ -48,6 +52,7 @@ class NavigationSystem:
             visualizer: Optional EmbeddedVisualizer for real-time visualization
         """
         self.planner = None
+        self.result = None  # PlanResult of the last run()
         self.env = env_data
         self.cfg = exec_config
         self.vis = visualizer
@@ -104,7 +109,8 @@ class NavigationSystem:
             grid_map: The grid map the planner will search on
             
         Returns:
-            A planner instance (AStarPlanner, BFSPlanner, or DFSPlanner)
+            A planner instance (AStarPlanner, BFSPlanner, DFSPlanner or
+            BidirectionalBFSPlanner)
             
         Raises:
             NotImplementedError: If the requested planner type is not supported
@@ -148,6 +154,12 @@ class NavigationSystem:
                 grid_map, motion_model=self.motion, visualizer=self.vis    
             )
 
+        # Bidirectional BFS - graph search only, use_tree_search is ignored
+        elif self.planner_name == "BIBFS":
+            return BidirectionalBFSPlanner(
+                grid_map, motion_model=self.motion, visualizer=self.vis
+            )
+
         else:
             raise NotImplementedError(
                 f"Planner '{self.planner_name}' not supported"
@@ -184,11 +196,7 @@ class NavigationSystem:
         # Obstacles are inflated during environment creation, so we verify
         # the inflation state here rather than re-inflating
         
-        inflated_count = sum(
-            grid_map.is_inflated(x, y)
-            for y in range(grid_map.height)
-            for x in range(grid_map.width)
-        )
+        inflated_count = int(np.count_nonzero(grid_map.inflated_grid))
 
         print("[NAV] Inflated cells:", inflated_count)
 
@@ -229,7 +237,8 @@ class NavigationSystem:
         # --------------------------------------------------
         # 5. Execute path planning algorithm
         # --------------------------------------------------
-        path = planner.plan(start, goal)
+        self.result = planner.plan_result(start, goal)
+        path = self.result.path
 
         if path:
             print("[NAV] Path length:", len(path)-1)